@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Import Pipeline Benchmarks
+
+This script times the stages of an import on synthetic exports of several
+sizes and writes the results to a JSON file, so that runs of different
+versions can be compared.
+
+Stages timed separately:
+    extract_zip         Extracting the export, without media, to a directory
+    parse_html_file     Parsing every extracted connection file
+    find_non_followers  Computing who doesn't follow back
+    parse_zip           Reading the connection files straight from the ZIP
+    view_population     Filling the Non-Followers tab (skipped without a display)
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --output results.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.synthetic_export import generate_export
+from instagram_manager import __version__
+from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.models.html_extractor import BACKENDS
+from instagram_manager.models.user_store import UserStore
+
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+def timed(function, repeat):
+    """
+    Time a function, keeping the fastest run.
+    
+    Args:
+        function (callable): Function to time; called ``repeat`` times
+        repeat (int): Number of runs
+        
+    Returns:
+        tuple: ``(seconds, result)`` of the fastest run
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best[0]:
+            best = (elapsed, result)
+    return best
+
+def connection_files(extract_dir):
+    """
+    List the extracted connection files with the relation each one holds.
+    
+    Args:
+        extract_dir (str): Directory the export was extracted to
+        
+    Returns:
+        list: ``(path, parser attribute)`` tuples
+    """
+    connections = os.path.join(extract_dir, "connections", "followers_and_following")
+    prefixes = (("followers_", "followers"), ("following", "following"),
+                ("follow_requests", "follow_requests"),
+                ("pending_follow_requests", "pending_sent_requests"))
+    files = []
+    for name in sorted(os.listdir(connections)):
+        for prefix, attribute in prefixes:
+            if name.startswith(prefix):
+                files.append((os.path.join(connections, name), attribute))
+                break
+    return files
+
+def populate_view(parser):
+    """
+    Time filling the Non-Followers tab, including the redraw.
+    
+    Args:
+        parser (InstagramDataParser): Parser holding the imported data
+        
+    Returns:
+        float: Seconds, or None if no display is available
+    """
+    try:
+        import tkinter as tk
+        from tkinter import ttk
+        from instagram_manager.ui.views.non_followers_view import NonFollowersTabView
+        root = tk.Tk()
+    except Exception as e:
+        print(f"  view_population skipped: {e}")
+        return None
+        
+    try:
+        frame = ttk.Frame(root)
+        frame.pack(fill=tk.BOTH, expand=True)
+        view = NonFollowersTabView(frame, parser, tk.StringVar(root))
+        root.update()
+        started = time.perf_counter()
+        view.update_view()
+        root.update()
+        return time.perf_counter() - started
+    finally:
+        root.destroy()
+
+def run_size(users, work_dir, repeat, backend):
+    """
+    Benchmark every stage on an export of one size.
+    
+    Args:
+        users (int): Number of people followed in the synthetic export
+        work_dir (str): Scratch directory
+        repeat (int): Runs per stage; the fastest is kept
+        backend (str): HTML extraction backend of the parser
+        
+    Returns:
+        list: One result dict per stage
+    """
+    zip_path = os.path.join(work_dir, f"export_{users}.zip")
+    print(f"Generating export with {users:,} users...")
+    counts = generate_export(zip_path, users)
+    zip_bytes = os.path.getsize(zip_path)
+    results = []
+    
+    def record(stage, seconds, records=None, size=None):
+        result = {"users": users, "stage": stage, "seconds": seconds,
+                  "records": records, "bytes": size}
+        results.append(result)
+        rate = f", {records / seconds:,.0f} records/s" if records and seconds else ""
+        print(f"  {stage:<20} {seconds:8.3f}s{rate}")
+        
+    parser = InstagramDataParser(backend)
+    extract_dir = os.path.join(work_dir, f"extract_{users}")
+    
+    def extract():
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        return parser.extract_zip(zip_path, extract_dir)
+        
+    seconds, _ = timed(extract, repeat)
+    record("extract_zip", seconds, size=zip_bytes)
+    
+    files = connection_files(extract_dir)
+    html_bytes = sum(os.path.getsize(path) for path, _ in files)
+    
+    def parse_files():
+        parsed = {}
+        for path, attribute in files:
+            parsed.setdefault(attribute, []).extend(parser.parse_html_file(path))
+        return parsed
+        
+    seconds, parsed = timed(parse_files, repeat)
+    record("parse_html_file", seconds, sum(len(records) for records in parsed.values()), html_bytes)
+    
+    for attribute, records in parsed.items():
+        setattr(parser, attribute, UserStore(parser.username_pool, records))
+    seconds, non_followers = timed(lambda: len(parser.find_non_followers()), repeat)
+    record("find_non_followers", seconds, non_followers)
+    
+    zip_parser = InstagramDataParser(backend)
+    seconds, _ = timed(lambda: zip_parser.parse_zip(zip_path), repeat)
+    record("parse_zip", seconds, sum(counts.values()), zip_bytes)
+    
+    seconds = populate_view(zip_parser)
+    if seconds is not None:
+        record("view_population", seconds, len(zip_parser.non_followers))
+        
+    shutil.rmtree(extract_dir, ignore_errors=True)
+    os.remove(zip_path)
+    return results
+
+def main():
+    """Parse the command line, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the Instagram export import pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="numbers of users of the synthetic exports")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage; the fastest is kept")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="stream",
+                        help="HTML extraction backend of the parser")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file to write")
+    args = parser.parse_args()
+    
+    # Parser logging would dominate the timings of the small exports
+    logging.disable(logging.INFO)
+    
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="instagram_manager_bench_")
+    try:
+        for users in args.sizes:
+            results.extend(run_size(users, work_dir, args.repeat, args.backend))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        
+    report = {
+        "version": __version__,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "backend": args.backend,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Startup Import Report
+
+This script measures what the GUI imports before its window can appear,
+using Python's ``-X importtime``, and lists the slowest modules. Run it
+before and after changing imports to check the startup path stays lean.
+
+Usage:
+    python benchmarks/startup_report.py --top 15 --output startup.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# What main.py imports before creating the window
+STARTUP_IMPORTS = "import tkinter, instagram_manager.main, instagram_manager.ui.app"
+
+def measure_imports(statement):
+    """
+    Run a statement in a fresh interpreter with ``-X importtime``.
+    
+    Args:
+        statement (str): Python statement doing the imports
+        
+    Returns:
+        dict: Module name to ``(self microseconds, cumulative microseconds)``
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+def fastest_run(statement, repeat):
+    """
+    Measure the imports several times, keeping each module's fastest time.
+    
+    Args:
+        statement (str): Python statement doing the imports
+        repeat (int): Number of interpreters to start
+        
+    Returns:
+        dict: Module name to ``(self microseconds, cumulative microseconds)``
+    """
+    best = {}
+    for _ in range(repeat):
+        for name, times in measure_imports(statement).items():
+            if name not in best or times[1] < best[name][1]:
+                best[name] = times
+    return best
+
+def main():
+    """Parse the command line, measure the startup imports and report them."""
+    parser = argparse.ArgumentParser(description="Report the imports on the GUI's startup path.")
+    parser.add_argument("--statement", default=STARTUP_IMPORTS, help="import statement to measure")
+    parser.add_argument("--repeat", type=int, default=5, help="runs; each module's fastest is kept")
+    parser.add_argument("--top", type=int, default=20, help="number of modules to list")
+    parser.add_argument("--output", help="JSON file to write the full measurements to")
+    args = parser.parse_args()
+    
+    modules = fastest_run(args.statement, args.repeat)
+    self_total = sum(self_us for self_us, _ in modules.values())
+    print(f"{len(modules)} modules imported in {self_total / 1000:.1f} ms")
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:8.1f}  {name}")
+        
+    if args.output:
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "statement": args.statement,
+            "total_ms": self_total / 1000,
+            "modules": {name: {"self_us": self_us, "cumulative_us": cumulative_us}
+                        for name, (self_us, cumulative_us) in modules.items()},
+        }
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
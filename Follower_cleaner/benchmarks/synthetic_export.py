@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Synthetic Instagram Export Generator
+
+This script builds Instagram data export ZIPs with the same layout as the
+real HTML exports: ``_a6-p`` record blocks, followers split into numbered
+shards, following, follow requests and pending requests, plus incompressible
+media and message files so the archive has a realistic mix of members.
+
+Usage:
+    python benchmarks/synthetic_export.py export.zip --users 100000
+"""
+
+import os
+import random
+import zipfile
+import argparse
+
+CONNECTIONS_DIR = "connections/followers_and_following"
+
+# Followers per shard, as in large real exports
+DEFAULT_SHARD_SIZE = 10000
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+PAGE_HEADER = ('<html><head><meta charset="utf-8"><title>{title}</title></head>'
+               '<body class="_5vb_ _2yq _a7o5"><div class="clearfix _ikh"><div class="_4bl9">'
+               '<div class="_li"><div class="_a705"><div class="_a706" role="main">\n')
+PAGE_FOOTER = '</div></div></div></div></div></body></html>\n'
+
+def record_block(username, date):
+    """
+    Render one user record block as it appears in the export.
+    
+    Args:
+        username (str): The username
+        date (str): Date text, or "" for records without a date
+        
+    Returns:
+        str: The HTML of the block
+    """
+    date_div = f"<div>{date}</div>" if date else ""
+    return ('<div class="pam _3-95 _2ph- _a6-g uiBoxWhite noborder"><div class="_a6-p"><div><div>'
+            f'<a target="_blank" href="https://www.instagram.com/{username}">{username}</a>'
+            f'</div>{date_div}</div></div></div>\n')
+
+def random_date(rng):
+    """Return a random date in the export's date format."""
+    hour = rng.randint(1, 12)
+    return (f"{rng.choice(MONTHS)} {rng.randint(1, 28):02d}, {rng.randint(2015, 2024)}, "
+            f"{hour}:{rng.randint(0, 59):02d} {rng.choice(('AM', 'PM'))}")
+
+def write_page(zip_ref, member_name, title, usernames, rng, dated=True):
+    """
+    Write a connection HTML file into the archive, streaming the blocks.
+    
+    Args:
+        zip_ref (zipfile.ZipFile): Archive open for writing
+        member_name (str): Name of the member to write
+        title (str): Page title
+        usernames (iterable): Usernames to write, in order
+        rng (random.Random): Random source for the dates
+        dated (bool): Whether the records carry a date
+    """
+    with zip_ref.open(member_name, 'w') as member:
+        member.write(PAGE_HEADER.format(title=title).encode('utf-8'))
+        batch = []
+        for username in usernames:
+            batch.append(record_block(username, random_date(rng) if dated else ""))
+            if len(batch) >= 1000:
+                member.write("".join(batch).encode('utf-8'))
+                batch = []
+        member.write("".join(batch).encode('utf-8'))
+        member.write(PAGE_FOOTER.encode('utf-8'))
+
+def generate_export(zip_path, users, shard_size=DEFAULT_SHARD_SIZE, media_mb=20, seed=0):
+    """
+    Build a synthetic export ZIP.
+    
+    The account follows ``users`` people and is followed by about as many;
+    roughly a third of the people followed don't follow back.
+    
+    Args:
+        zip_path (str): Path of the ZIP to create
+        users (int): Number of people followed
+        shard_size (int): Followers per ``followers_N.html`` shard
+        media_mb (int): Megabytes of media and message filler
+        seed (int): Random seed, so the same arguments give the same export
+        
+    Returns:
+        dict: Number of records written per relation
+    """
+    rng = random.Random(seed)
+    following = [f"user_{i:07d}" for i in range(users)]
+    followers = [name for name in following if rng.random() >= 1 / 3]
+    followers += [f"fan_{i:07d}" for i in range(users - len(followers))]
+    rng.shuffle(followers)
+    requests = [f"requester_{i:05d}" for i in range(max(1, users // 100))]
+    pending = [f"pending_{i:05d}" for i in range(max(1, users // 200))]
+    
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        shards = range(0, len(followers), shard_size) if followers else [0]
+        for number, start in enumerate(shards, 1):
+            write_page(zip_ref, f"{CONNECTIONS_DIR}/followers_{number}.html", "Followers",
+                       followers[start:start + shard_size], rng, dated=False)
+        write_page(zip_ref, f"{CONNECTIONS_DIR}/following.html", "Following", following, rng)
+        write_page(zip_ref, f"{CONNECTIONS_DIR}/follow_requests_you've_received.html",
+                   "Follow requests", requests, rng)
+        write_page(zip_ref, f"{CONNECTIONS_DIR}/pending_follow_requests.html",
+                   "Pending follow requests", pending, rng)
+                   
+        # Photos and videos don't compress; spread the filler over many files
+        file_size = 512 * 1024
+        for number in range(media_mb * 2):
+            folder = "media/posts" if number % 4 else "your_instagram_activity/messages/inbox/chat/photos"
+            zip_ref.writestr(zipfile.ZipInfo(f"{folder}/{number:05d}.jpg"), os.urandom(file_size),
+                             compress_type=zipfile.ZIP_STORED)
+                             
+    return {"following": len(following), "followers": len(followers),
+            "follow_requests": len(requests), "pending_requests": len(pending)}
+
+def main():
+    """Parse the command line and generate an export."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic Instagram data export ZIP.")
+    parser.add_argument("zip_path", help="path of the ZIP to create")
+    parser.add_argument("--users", type=int, default=1000, help="number of people followed")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="followers per followers_N.html shard")
+    parser.add_argument("--media-mb", type=int, default=20, help="megabytes of media filler")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    
+    counts = generate_export(args.zip_path, args.users, args.shard_size, args.media_mb, args.seed)
+    print(f"Wrote {args.zip_path}: " + ", ".join(f"{count} {name}" for name, count in counts.items()))
+
+if __name__ == "__main__":
+    main()
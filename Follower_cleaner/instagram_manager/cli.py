@@ -0,0 +1,300 @@
+"""
+Command Line Module
+
+This module provides a headless batch mode that analyses many Instagram
+data exports at once and writes the results to files.
+"""
+
+import os
+import csv
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.models.parse_cache import DEFAULT_CACHE_DIR, ParseCache
+from instagram_manager.utils.instrumentation import ImportTrace
+from instagram_manager.utils.logger import setup_logger
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("jsonl", "csv")
+
+# Result files written per account: file stem -> parser attribute
+OUTPUT_RELATIONS = (
+    ("non_followers", "non_followers"),
+    ("follow_requests", "follow_requests"),
+    ("pending_requests", "pending_sent_requests"),
+)
+
+# Relations counted as parsed records in the throughput summary
+PARSED_RELATIONS = ("follow_requests", "pending_sent_requests", "followers", "following")
+
+def find_exports(paths):
+    """
+    Collect the export ZIPs to analyse.
+    
+    Args:
+        paths (list): ZIP files and/or directories containing ZIP files
+        
+    Returns:
+        list: Paths of the export ZIPs, directories expanded in name order
+    """
+    exports = []
+    for path in paths:
+        if os.path.isdir(path):
+            exports.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                           if name.lower().endswith(".zip"))
+        else:
+            exports.append(path)
+    return exports
+
+def write_records(store, file_path, output_format):
+    """
+    Write user records to a JSONL or CSV file.
+    
+    Args:
+        store (UserStore): Records to write
+        file_path (str): Path of the output file, without extension
+        output_format (str): "jsonl" or "csv"
+        
+    Returns:
+        str: Path of the written file
+    """
+    file_path = f"{file_path}.{output_format}"
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        if output_format == "csv":
+            writer = csv.writer(file)
+            writer.writerow(("username", "url", "timestamp"))
+            for index in range(len(store)):
+                writer.writerow((store.username(index), store.url(index), store.timestamp(index)))
+        else:
+            for index in range(len(store)):
+                file.write(json.dumps({
+                    "username": store.username(index),
+                    "url": store.url(index),
+                    "timestamp": store.timestamp(index),
+                }) + "\n")
+    return file_path
+
+def analyse_export(zip_path, account_dir, output_format, cache_dir=None, trace_dir=None):
+    """
+    Parse one export and write its results.
+    
+    Runs in a worker process; each export is parsed in that single process
+    so the batch, not the export, is the unit spread over the cores. Errors
+    are reported in the summary rather than raised, so one bad export
+    can't stop the rest of the batch.
+    
+    Args:
+        zip_path (str): Path to the Instagram data export ZIP
+        account_dir (str): Directory to write the account's result files to
+        output_format (str): "jsonl" or "csv"
+        cache_dir (str, optional): Directory of the parse cache, or None to
+            parse without a cache
+        trace_dir (str, optional): Directory to write a JSON trace of the
+            import to
+            
+    Returns:
+        dict: Summary with the export and output paths, success flag, record counts,
+            parse time, the files that couldn't be parsed and, on failure, the error
+    """
+    started = time.perf_counter()
+    summary = {"export": zip_path, "output": account_dir, "success": False, "records": 0, "counts": {},
+               "failed_files": []}
+    try:
+        parser = InstagramDataParser()
+        cache = ParseCache(cache_dir) if cache_dir else None
+        trace = ImportTrace(zip_path)
+        if parser.parse_zip(zip_path, max_workers=1, cache=cache, trace=trace):
+            os.makedirs(account_dir, exist_ok=True)
+            for file_stem, attribute in OUTPUT_RELATIONS:
+                store = getattr(parser, attribute)
+                write_records(store, os.path.join(account_dir, file_stem), output_format)
+                summary["counts"][file_stem] = len(store)
+            summary["records"] = sum(len(getattr(parser, attribute)) for attribute in PARSED_RELATIONS)
+            summary["failed_files"] = parser.failed_files
+            summary["success"] = True
+        else:
+            summary["error"] = "failed to read export"
+            
+        trace.log_summary()
+        if trace_dir:
+            trace.write_json(trace_dir)
+    except Exception as e:
+        logger.error(f"Error analysing {zip_path}: {e}", exc_info=True)
+        summary["success"] = False
+        summary["error"] = str(e)
+    summary["seconds"] = time.perf_counter() - started
+    return summary
+
+def failed_summary(zip_path, account_dir, error):
+    """
+    Build the summary of an export that couldn't be analysed.
+    
+    Args:
+        zip_path (str): Path to the Instagram data export ZIP
+        account_dir (str): Directory the account's result files were meant for
+        error (str): What went wrong
+        
+    Returns:
+        dict: Summary in the format of ``analyse_export``
+    """
+    return {"export": zip_path, "output": account_dir, "success": False, "records": 0,
+            "counts": {}, "seconds": 0.0, "failed_files": [], "error": error}
+
+def account_directories(exports, output_dir):
+    """
+    Choose an output directory per export, named after the ZIP file.
+    
+    Args:
+        exports (list): Paths of the export ZIPs
+        output_dir (str): Base output directory
+        
+    Returns:
+        list: Output directory for each export, in the same order
+    """
+    directories = []
+    used = set()
+    for zip_path in exports:
+        stem = os.path.splitext(os.path.basename(zip_path))[0]
+        name, number = stem, 1
+        while name in used:
+            number += 1
+            name = f"{stem}_{number}"
+        used.add(name)
+        directories.append(os.path.join(output_dir, name))
+    return directories
+
+def run_batch(exports, output_dir, output_format="jsonl", workers=None, cache_dir=None, trace_dir=None):
+    """
+    Analyse export ZIPs concurrently in a process pool.
+    
+    Falls back to analysing the remaining exports one after the other if
+    worker processes cannot be started or the pool breaks. An export that
+    fails is reported as failed in its summary; the others carry on.
+    
+    Args:
+        exports (list): Paths of the export ZIPs
+        output_dir (str): Directory to write one result directory per export to
+        output_format (str): "jsonl" or "csv"
+        workers (int, optional): Number of worker processes; defaults to the
+            number of CPUs
+        cache_dir (str, optional): Directory of the parse cache
+        trace_dir (str, optional): Directory to write a JSON trace per export to
+        
+    Returns:
+        list: Per-export summaries, in completion order
+    """
+    jobs = list(zip(exports, account_directories(exports, output_dir)))
+    workers = max(1, min(len(jobs), workers or os.cpu_count() or 1))
+    results = []
+    
+    def finished(summary):
+        results.append(summary)
+        if summary["success"]:
+            counts = ", ".join(f"{count} {name.replace('_', ' ')}" for name, count in summary["counts"].items())
+            print(f"{summary['export']}: {counts} ({summary['seconds']:.2f}s)")
+            if summary["failed_files"]:
+                print(f"{summary['export']}: incomplete, failed to parse {', '.join(summary['failed_files'])}",
+                      file=sys.stderr)
+        else:
+            print(f"{summary['export']}: {summary['error']}", file=sys.stderr)
+            
+    def collect(future, zip_path, account_dir):
+        # analyse_export reports its own errors; anything else but a broken
+        # pool (e.g. an unpicklable result) fails this export only
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            logger.error(f"Error analysing {zip_path}: {e}", exc_info=True)
+            return failed_summary(zip_path, account_dir, str(e))
+            
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(analyse_export, zip_path, account_dir, output_format,
+                                       cache_dir, trace_dir): (zip_path, account_dir)
+                       for zip_path, account_dir in jobs}
+            for future in as_completed(futures):
+                finished(collect(future, *futures[future]))
+    except (OSError, BrokenProcessPool) as e:
+        logger.warning(f"Process pool unavailable ({e}), analysing exports in-process")
+        done = {summary["output"] for summary in results}
+        for zip_path, account_dir in jobs:
+            if account_dir not in done:
+                finished(analyse_export(zip_path, account_dir, output_format, cache_dir, trace_dir))
+    return results
+
+def format_summary(results, elapsed):
+    """
+    Summarize the throughput of a batch run.
+    
+    Args:
+        results (list): Per-export summaries from ``run_batch``
+        elapsed (float): Wall-clock duration of the batch in seconds
+        
+    Returns:
+        str: Human readable summary
+    """
+    succeeded = [summary for summary in results if summary["success"]]
+    records = sum(summary["records"] for summary in succeeded)
+    elapsed = max(elapsed, 1e-9)
+    return (f"Analysed {len(succeeded)}/{len(results)} exports, {records:,} records "
+            f"in {elapsed:.2f}s ({len(succeeded) / elapsed:.2f} exports/s, "
+            f"{records / elapsed:,.0f} records/s)")
+
+def build_argument_parser():
+    """
+    Build the command line argument parser.
+    
+    Returns:
+        argparse.ArgumentParser: The argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="instagram_manager",
+        description="Analyse Instagram data exports without the GUI.")
+    parser.add_argument("exports", nargs="+",
+                        help="export ZIP files, or directories containing them")
+    parser.add_argument("-o", "--output", default="instagram_manager_results",
+                        help="directory to write one result directory per export to")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="jsonl",
+                        help="format of the result files (default: jsonl)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="don't read or update the cache of parsed exports")
+    parser.add_argument("--trace-dir", default=None,
+                        help="write a JSON trace (Chrome trace format) of every import to this directory")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="log parsing details and per-stage timings")
+    return parser
+
+def main(argv=None):
+    """
+    Run the batch mode.
+    
+    Args:
+        argv (list, optional): Command line arguments, without the program name
+        
+    Returns:
+        int: Exit status, 0 if every export was analysed
+    """
+    args = build_argument_parser().parse_args(argv)
+    setup_logger(logging.INFO if args.verbose else logging.WARNING)
+    
+    exports = find_exports(args.exports)
+    if not exports:
+        print("No export ZIP files found", file=sys.stderr)
+        return 1
+        
+    cache_dir = None if args.no_cache else DEFAULT_CACHE_DIR
+    started = time.perf_counter()
+    results = run_batch(exports, args.output, args.format, args.workers, cache_dir, args.trace_dir)
+    print(format_summary(results, time.perf_counter() - started))
+    return 0 if all(summary["success"] for summary in results) else 1
@@ -9,25 +9,57 @@ This application allows you to:
 - View pending follow requests
 - Identify users you follow who don't follow you back
 
+Run without arguments to start the GUI, or pass export ZIPs (or
+directories of them) to analyse them headlessly, e.g.
+``python -m instagram_manager.main exports/ -o results --format csv``.
+
 Author: Your Name
 License: MIT
 """
 
+import time
+
+# Taken before anything else is imported, for the startup report
+STARTED = time.perf_counter()
+
 import sys
-import tkinter as tk
-from instagram_manager.ui.app import InstagramManagerApp
 from instagram_manager.utils.logger import setup_logger
+from instagram_manager.utils.startup import StartupTimer, warm_up
 
 def main():
     """Main entry point for the application."""
+    # Needed for the parser's worker processes in the frozen executable
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    
+    # Arguments select the headless batch mode, which doesn't need Tk
+    if len(sys.argv) > 1:
+        from instagram_manager.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
     # Setup logging
     logger = setup_logger()
     logger.info("Starting Instagram Account Manager")
+    startup = StartupTimer(STARTED)
     
     try:
+        import tkinter as tk
+        from instagram_manager.ui.app import InstagramManagerApp
+        startup.mark("imports")
+        
         # Initialize the Tkinter application
         root = tk.Tk()
         app = InstagramManagerApp(root)
+        startup.mark("window built")
+        
+        # Paint the window before anything else competes for the CPU
+        root.update()
+        startup.mark("window shown")
+        startup.log_report()
+        
+        # What an import needs loads while the user picks a file
+        warm_up()
         root.mainloop()
     except Exception as e:
         logger.error(f"Application error: {e}", exc_info=True)
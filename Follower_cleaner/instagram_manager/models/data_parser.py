@@ -4,99 +4,471 @@ Instagram Data Parser Module
 This module handles parsing and processing of Instagram data exports.
 """
 
+import io
 import os
-import zipfile
+import time
+import zlib
 import logging
-from bs4 import BeautifulSoup
+from datetime import datetime
+from collections import deque
+
+from instagram_manager.models.export_index import ExportIndex, ExtractManifest
+from instagram_manager.models.parse_cache import CACHED_RELATIONS
+from instagram_manager.models.user_index import UserIndex
+from instagram_manager.models.user_store import SECONDS_PER_DAY, UsernamePool, UserStore, export_timestamp
+from instagram_manager.utils.instrumentation import ImportTrace
+
+# zipfile, the process pool and the HTML and JSON extractors are imported
+# where they are used, keeping them off the GUI's startup path;
+# utils.startup warms them up instead
 
 logger = logging.getLogger(__name__)
 
+# HTML extraction backends, as in html_extractor.BACKENDS
+HTML_BACKENDS = ("stream", "bs4", "mmap")
+
+# Relations shown in list views, which get a search index
+INDEXED_RELATIONS = ("follow_requests", "pending_sent_requests", "non_followers")
+
+# Records scanned between cancellation checks by the file backends
+CANCEL_CHECK_INTERVAL = 4096
+
+# Seconds between cancellation checks while waiting for a worker process
+CANCEL_POLL_SECONDS = 0.1
+
+# Bytes read at a time when extracting or checking extracted files
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+class ImportCancelled(Exception):
+    """Raised when an import is cancelled before it has finished."""
+
+class _WorkerError(Exception):
+    """Raised when a worker process failed to parse a member, as opposed to the pool failing."""
+
 class InstagramDataParser:
     """
     Parser for Instagram data exports.
     
-    This class handles extracting and parsing HTML files from Instagram's
-    data exports to collect information about followers, following,
+    This class handles extracting and parsing the HTML or JSON files of
+    Instagram's data exports to collect information about followers, following,
     and follow requests.
     """
     
-    def __init__(self):
-        """Initialize the parser with empty data structures."""
-        self.follow_requests = []
-        self.followers = []
-        self.following = []
-        self.non_followers = []  # People you follow who don't follow you back
-        self.pending_sent_requests = []  # People you've requested to follow
+    def __init__(self, backend="stream"):
+        """
+        Initialize the parser with empty data structures.
+        
+        Args:
+            backend (str): HTML extraction backend, either "stream" (single
+                pass, no document tree), "bs4" (BeautifulSoup selectors) or
+                "mmap" (byte-level scan of memory-mapped files on disk; ZIP
+                members are read as with "stream")
+        """
+        if backend not in HTML_BACKENDS:
+            raise ValueError(f"Unknown HTML backend: {backend}")
+        self.backend = backend
+        # Relations are compact UserStores sharing one pool of usernames
+        self.username_pool = UsernamePool()
+        self.follow_requests = UserStore(self.username_pool)
+        self.followers = UserStore(self.username_pool)
+        self.following = UserStore(self.username_pool)
+        self.non_followers = UserStore(self.username_pool)  # People you follow who don't follow you back
+        self.pending_sent_requests = UserStore(self.username_pool)  # People you've requested to follow
+        # Search indexes of the relations, by attribute name
+        self.user_indexes = {}
+        # Bumped whenever the relations are replaced, so views can tell stale data
+        self.data_version = 0
+        # Files of the last import that couldn't be parsed; their records are missing
+        self.failed_files = []
     
-    def extract_zip(self, zip_path, extract_dir):
+    def extract_zip(self, zip_path, extract_dir, trace=None, manifest=None, max_workers=None):
         """
         Extract Instagram data zip file.
         
+        Only the members selected by the manifest are extracted, which by
+        default leaves out photos, videos and message attachments. Members
+        are decompressed concurrently on a thread pool, and files that an
+        earlier extraction left with the same size and CRC are kept as is.
+        
         Args:
             zip_path (str): Path to the Instagram data zip file
             extract_dir (str): Directory to extract files to
+            trace (ImportTrace, optional): Trace to record the extraction in
+            manifest (ExtractManifest, optional): Members to extract; defaults
+                to everything but media and message attachments
+            max_workers (int, optional): Number of extraction threads
             
         Returns:
             bool: True if extraction succeeded, False otherwise
         """
+        import zipfile
+        from concurrent.futures import ThreadPoolExecutor
+        
+        manifest = manifest if manifest is not None else ExtractManifest()
+        trace = trace if trace is not None else ImportTrace(zip_path)
         try:
             logger.info(f"Extracting {zip_path} to {extract_dir}")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+            with trace.span("extract", "extract") as span, zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                targets = []
+                for info in manifest.select(zip_ref.infolist()):
+                    path = _member_path(extract_dir, info.filename)
+                    if path is None:
+                        logger.warning(f"Skipping member with unsafe name: {info.filename}")
+                        continue
+                    # Directories are made up front so threads never race to create them
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    targets.append((info, path))
+                    
+                # Largest first, so no big member is left to finish on its own
+                targets.sort(key=lambda target: target[0].compress_size, reverse=True)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    extracted = list(executor.map(lambda target: _extract_member(zip_ref, *target), targets))
+                span.records = sum(extracted)
+                span.bytes = sum(info.file_size for (info, _), done in zip(targets, extracted) if done)
+            logger.info(f"Extracted {span.records} of {len(targets)} wanted files ({span.bytes:,} bytes) "
+                        f"in {span.seconds:.3f}s; {len(targets) - span.records} were already up to date")
             return True
         except Exception as e:
             logger.error(f"Error extracting zip: {e}", exc_info=True)
             return False
     
-    def parse_html_file(self, file_path):
+    def parse_html_file(self, file_path, cancel_event=None):
         """
         Parse HTML files and extract username data.
         
         Args:
-            file_path (str): Path to the HTML file to parse
+            file_path (str or file): Path to the HTML file to parse, or an
+                already opened text stream (e.g. a member of the export ZIP)
+            cancel_event (threading.Event, optional): When set, parsing stops
+                at the next read from the file
             
         Returns:
-            list: List of dictionaries containing user data
+            list: List of dictionaries containing user data, empty if the
+                file couldn't be parsed (it is then added to ``failed_files``)
+            
+        Raises:
+            ImportCancelled: If ``cancel_event`` was set during parsing
         """
+        from instagram_manager.models.html_extractor import BACKENDS, FILE_BACKENDS
+        
+        source_name = getattr(file_path, 'name', file_path)
         try:
-            logger.info(f"Parsing HTML file: {file_path}")
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                
-            soup = BeautifulSoup(content, 'html.parser')
+            logger.info(f"Parsing HTML file: {source_name} ({self.backend} backend)")
+            extract = BACKENDS[self.backend]
+            if hasattr(file_path, 'read'):
+                results = extract(_CancellableStream(file_path, cancel_event))
+            elif self.backend in FILE_BACKENDS:
+                results = []
+                for record in FILE_BACKENDS[self.backend](file_path):
+                    if len(results) % CANCEL_CHECK_INTERVAL == 0:
+                        _check_cancelled(cancel_event)
+                    results.append(record)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    results = extract(_CancellableStream(file, cancel_event))
+            
+            logger.info(f"Found {len(results)} users in {source_name}")
+            return results
+        except ImportCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Error parsing HTML file {source_name}: {e}", exc_info=True)
+            self.failed_files.append(source_name)
+            return []
+    
+    def parse_json_file(self, file_path, cancel_event=None):
+        """
+        Parse JSON files and extract username data.
+        
+        Args:
+            file_path (str or file): Path to the JSON file to parse, or an
+                already opened text stream (e.g. a member of the export ZIP)
+            cancel_event (threading.Event, optional): When set, parsing stops
+                at the next read from the file
+            
+        Returns:
+            list: List of dictionaries containing user data, empty if the
+                file couldn't be parsed (it is then added to ``failed_files``)
+            
+        Raises:
+            ImportCancelled: If ``cancel_event`` was set during parsing
+        """
+        from instagram_manager.models.json_extractor import extract_records_json
+        
+        source_name = getattr(file_path, 'name', file_path)
+        try:
+            logger.info(f"Parsing JSON file: {source_name}")
+            if hasattr(file_path, 'read'):
+                results = extract_records_json(_CancellableStream(file_path, cancel_event))
+            else:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    results = extract_records_json(_CancellableStream(file, cancel_event))
+            
+            logger.info(f"Found {len(results)} users in {source_name}")
+            return results
+        except ImportCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Error parsing JSON file {source_name}: {e}", exc_info=True)
+            self.failed_files.append(source_name)
+            return []
+    
+    def parse_zip_member(self, zip_ref, member_name, cancel_event=None):
+        """
+        Parse an HTML or JSON file straight out of the export ZIP.
+        
+        The member is decompressed as a stream, so nothing is written to disk.
+        Its format is taken from its extension.
+        
+        Args:
+            zip_ref (zipfile.ZipFile): The open export archive
+            member_name (str): Name of the member to parse
+            cancel_event (threading.Event, optional): When set, parsing stops
+                at the next read from the member
+            
+        Returns:
+            list: List of dictionaries containing user data
+        """
+        with zip_ref.open(member_name) as member:
+            stream = io.TextIOWrapper(member, encoding='utf-8')
+            if member_name.lower().endswith(".json"):
+                return self.parse_json_file(stream, cancel_event)
+            return self.parse_html_file(stream, cancel_event)
+    
+    def _parse_traced_member(self, zip_ref, member, trace, cancel_event=None):
+        """
+        Parse an export member in this process, recording a span for it.
+        
+        Args:
+            zip_ref (zipfile.ZipFile): The open export archive
+            member (tuple): ``(member_name, attribute, description, size)``
+            trace (ImportTrace): Trace to record the parse in
+            cancel_event (threading.Event, optional): Set to stop parsing
             
-            # Extract user data from HTML elements
-            username_elements = soup.select("div._a6-p div div a")
-            date_elements = soup.select("div._a6-p div div:nth-of-type(2)")
+        Returns:
+            list: List of dictionaries containing user data
+        """
+        member_name, _, _, size = member
+        with trace.span(member_name.rsplit("/", 1)[-1], "parse") as span:
+            records = self.parse_zip_member(zip_ref, member_name, cancel_event)
+            span.records = len(records)
+            span.bytes = size
+        return records
+    
+    def parse_zip(self, zip_path, progress_callback=None, max_workers=None, cache=None,
+                  cancel_event=None, trace=None):
+        """
+        Parse the connection files directly from an Instagram data export ZIP.
+        
+        Only the follow requests, pending requests, followers and following
+        files are read, from the HTML or the JSON files depending on the
+        format the export was requested in; the rest of the archive (photos, videos, messages)
+        is never extracted. Every shard of a split followers or following
+        list is parsed in its own worker process, so the parse trees never
+        live in the calling process, and the shards are merged (dropping
+        duplicate usernames) as they come back. Progress is reported in
+        proportion to the uncompressed bytes parsed so far.
+        
+        Args:
+            zip_path (str): Path to the Instagram data zip file
+            progress_callback (callable, optional): Called as
+                ``progress_callback(percent, message)`` as files are parsed
+            max_workers (int, optional): Number of worker processes to use.
+                Defaults to the number of CPUs; 1 parses in this process.
+            cache (ParseCache, optional): Cache of previously parsed exports;
+                on a hit the archive's connection files are not parsed again
+            cancel_event (threading.Event, optional): When set, parsing stops
+                between files and within the file being parsed; the parser's
+                relations are then left partially filled
+            trace (ImportTrace, optional): Trace to record the time, records
+                and bytes of every stage in
+            
+        Returns:
+            bool: True if the archive was read, False otherwise. Files that
+                couldn't be parsed are listed in ``failed_files``; the import
+                is then incomplete and isn't cached.
             
-            results = []
-            for i in range(len(username_elements)):
-                username = username_elements[i].text.strip()
+        Raises:
+            ImportCancelled: If ``cancel_event`` was set before parsing finished
+        """
+        def report(percent, message):
+            _check_cancelled(cancel_event)
+            if progress_callback:
+                progress_callback(percent, message)
+        
+        import zipfile
+        
+        trace = trace if trace is not None else ImportTrace(zip_path)
+        try:
+            logger.info(f"Reading connection files from {zip_path}")
+            report(5, "Reading zip file...")
+            members = []
+            self.failed_files = []
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                self.username_pool = UsernamePool()
+                with trace.span("cache_load", "cache") as span:
+                    cache_key = cache.archive_key(zip_ref) if cache else None
+                    cached = cache.load(cache_key, self.username_pool) if cache else None
+                    span.records = sum(len(store) for store in cached.values()) if cached else 0
+                if cached:
+                    report(50, "Loading previously parsed data...")
+                    for attribute, store in cached.items():
+                        setattr(self, attribute, store)
+                    report(90, "Finding non-followers...")
+                    self._find_traced_non_followers(trace)
+                    return True
                 
-                # Extract date if available
-                date_str = ""
-                if i < len(date_elements):
-                    date_str = date_elements[i].text.strip()
+                # One pass over the central directory; every lookup below is a dict lookup
+                index = ExportIndex.from_zip(zip_ref)
+                logger.info(f"Export is in {index.export_format.upper()} format ({len(index)} files)")
                 
-                # Extract username from URL as fallback
-                if not username and "instagram.com/" in username_elements[i]['href']:
-                    username = username_elements[i]['href'].split("instagram.com/")[1].strip()
-                    if username.endswith("/"):
-                        username = username[:-1]
+                for field, attribute, description in [
+                    ("follow_requests", "follow_requests", "follow requests received"),
+                    ("pending_requests", "pending_sent_requests", "pending follow requests sent"),
+                ]:
+                    member_name = index.member(field)
+                    if member_name:
+                        members.append((member_name, attribute, description, index.size(member_name)))
+                    else:
+                        logger.warning(f"{getattr(index.layout, field)} not found in {zip_path}")
                 
-                if username:
-                    results.append({
-                        "username": username,
-                        "url": username_elements[i]['href'] if 'href' in username_elements[i].attrs
-                                else f"https://www.instagram.com/{username}/",
-                        "timestamp": date_str
-                    })
-            
-            logger.info(f"Found {len(results)} users in {file_path}")
-            return results
+                for attribute in ("followers", "following"):
+                    shards = index.shards(attribute)
+                    if not shards:
+                        logger.warning(f"No {attribute} files found in {zip_path}")
+                    for number, member_name in enumerate(shards, 1):
+                        members.append((member_name, attribute, f"{attribute} ({number}/{len(shards)})",
+                                        index.size(member_name)))
+                
+                merger = _RelationMerger(self, CACHED_RELATIONS)
+                progress = _ByteProgress(members, report)
+                if max_workers == 1 or len(members) <= 1:
+                    for member in members:
+                        progress.report(f"Processing {member[2]}...")
+                        merger.merge(member[1], self._parse_traced_member(zip_ref, member, trace, cancel_event))
+                        progress.advance(member)
+                else:
+                    self._parse_members_in_pool(zip_path, members, merger, progress, max_workers,
+                                                cancel_event, trace)
+        except ImportCancelled:
+            logger.info(f"Import of {zip_path} cancelled")
+            raise
         except Exception as e:
-            logger.error(f"Error parsing HTML file {file_path}: {e}", exc_info=True)
-            return []
+            logger.error(f"Error reading zip: {e}", exc_info=True)
+            return False
+        
+        _check_cancelled(cancel_event)
+        if self.failed_files:
+            # Caching would hide the missing records on every later import
+            logger.warning(f"Import of {zip_path} is incomplete, failed to parse: "
+                           f"{', '.join(self.failed_files)}")
+        # An archive without connection files may be read differently by a later version
+        elif cache and members:
+            with trace.span("cache_store", "cache"):
+                cache.store(cache_key, {attribute: getattr(self, attribute) for attribute in CACHED_RELATIONS})
+        
+        report(90, "Finding non-followers...")
+        self._find_traced_non_followers(trace)
+        return True
+    
+    def _find_traced_non_followers(self, trace):
+        """
+        Find the non-followers, recording a span for it.
+        
+        Args:
+            trace (ImportTrace): Trace to record the computation in
+        """
+        with trace.span("find_non_followers", "non_followers") as span:
+            span.records = len(self.following) + len(self.followers)
+            self.find_non_followers()
+    
+    def _parse_members_in_pool(self, zip_path, members, merger, progress, max_workers,
+                               cancel_event=None, trace=None):
+        """
+        Parse export members concurrently in a process pool.
+        
+        Only a small window of members is in flight at a time and results
+        are merged in member order, so memory stays bounded by a few shards
+        rather than the whole export. Falls back to parsing in this process
+        if worker processes cannot be started or the pool breaks; a member
+        that fails in a worker fails the import, as it would in this
+        process. On cancellation, members not yet started are dropped and
+        the running ones stop at their next read, without being waited for.
+        
+        Args:
+            zip_path (str): Path to the Instagram data zip file
+            members (list): ``(member_name, attribute, description, size)`` tuples
+            merger (_RelationMerger): Merger collecting the parsed records
+            progress (_ByteProgress): Progress of the parse
+            max_workers (int): Maximum number of worker processes, or None
+            cancel_event (threading.Event, optional): Set to stop parsing
+            trace (ImportTrace, optional): Trace to record the parse of every member in
+        """
+        import zipfile
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+        from concurrent.futures.process import BrokenProcessPool
+        
+        trace = trace if trace is not None else ImportTrace(zip_path)
+        workers = min(len(members), max_workers or os.cpu_count() or 1)
+        progress.report(f"Processing {len(members)} files on {workers} workers...")
+        
+        def merge_next(in_flight):
+            member, future = in_flight.popleft()
+            # Wake up now and then to notice a cancellation while the worker parses
+            timeout = None if cancel_event is None else CANCEL_POLL_SECONDS
+            while True:
+                _check_cancelled(cancel_event)
+                try:
+                    records, failed_files, started, seconds, process = future.result(timeout)
+                    break
+                except FutureTimeoutError:
+                    pass
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    # The pool works; the member itself couldn't be read
+                    raise _WorkerError(f"Worker failed to parse {member[0]}: {e}") from e
+            trace.record(member[0].rsplit("/", 1)[-1], "parse", started, seconds,
+                         len(records), member[3], process)
+            self.failed_files.extend(failed_files)
+            merger.merge(member[1], records)
+            progress.advance(member)
+            progress.report(f"Processed {member[2]}")
+        
+        try:
+            context = multiprocessing.get_context()
+            # Inherited by the workers, which check it on every read
+            worker_cancel_event = context.Event()
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                           initializer=_init_parse_worker,
+                                           initargs=(worker_cancel_event,))
+            in_flight = deque()
+            try:
+                for member in members:
+                    _check_cancelled(cancel_event)
+                    future = executor.submit(_parse_zip_member_worker, zip_path, member[0], self.backend)
+                    in_flight.append((member, future))
+                    if len(in_flight) > workers:
+                        merge_next(in_flight)
+                while in_flight:
+                    merge_next(in_flight)
+            except BaseException:
+                # Stop the running workers too, and don't wait for them
+                worker_cancel_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Process pool unavailable ({e}), parsing in-process")
+            merger.reset()
+            progress.restart()
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                for member in members:
+                    _check_cancelled(cancel_event)
+                    merger.merge(member[1], self._parse_traced_member(zip_ref, member, trace, cancel_event))
+                    progress.advance(member)
+                    progress.report(f"Processed {member[2]}")
     
     def parse_follow_requests(self, file_path):
         """
@@ -106,9 +478,9 @@ class InstagramDataParser:
             file_path (str): Path to the follow requests HTML file
             
         Returns:
-            list: List of follow requests
+            UserStore: Follow requests
         """
-        self.follow_requests = self.parse_html_file(file_path)
+        self.follow_requests = UserStore(self.username_pool, self.parse_html_file(file_path))
         return self.follow_requests
     
     def parse_pending_sent_requests(self, file_path):
@@ -119,9 +491,9 @@ class InstagramDataParser:
             file_path (str): Path to the pending follow requests HTML file
             
         Returns:
-            list: List of pending follow requests you've sent
+            UserStore: Pending follow requests you've sent
         """
-        self.pending_sent_requests = self.parse_html_file(file_path)
+        self.pending_sent_requests = UserStore(self.username_pool, self.parse_html_file(file_path))
         return self.pending_sent_requests
         
     def parse_followers(self, file_path):
@@ -132,9 +504,9 @@ class InstagramDataParser:
             file_path (str): Path to the followers HTML file
             
         Returns:
-            list: List of followers
+            UserStore: Followers
         """
-        self.followers = self.parse_html_file(file_path)
+        self.followers = UserStore(self.username_pool, self.parse_html_file(file_path))
         return self.followers
     
     def parse_following(self, file_path):
@@ -145,25 +517,326 @@ class InstagramDataParser:
             file_path (str): Path to the following HTML file
             
         Returns:
-            list: List of users you follow
+            UserStore: Users you follow
         """
-        self.following = self.parse_html_file(file_path)
+        self.following = UserStore(self.username_pool, self.parse_html_file(file_path))
         return self.following
     
+    def replace_data(self, other):
+        """
+        Take over the parsed data of another parser.
+        
+        Lets an import parse into a fresh parser in the background and swap
+        the result in on the main thread, so views holding this parser
+        never see a half-filled import.
+        
+        Args:
+            other (InstagramDataParser): Parser holding a finished import
+        """
+        self.username_pool = other.username_pool
+        self.follow_requests = other.follow_requests
+        self.followers = other.followers
+        self.following = other.following
+        self.non_followers = other.non_followers
+        self.pending_sent_requests = other.pending_sent_requests
+        self.user_indexes = other.user_indexes
+        self.failed_files = other.failed_files
+        self.data_version += 1
+    
+    def user_index(self, attribute):
+        """
+        Get the search index of a relation, building it if needed.
+        
+        Indexes are kept until the relation is replaced, e.g. by the next
+        import, so they are built once per import.
+        
+        Args:
+            attribute (str): Name of the relation attribute
+            
+        Returns:
+            UserIndex: Index of the relation's current records
+        """
+        store = getattr(self, attribute)
+        index = self.user_indexes.get(attribute)
+        if index is None or index.store is not store:
+            index = UserIndex(store)
+            self.user_indexes[attribute] = index
+        return index
+    
+    def build_indexes(self):
+        """Build the search and sort indexes of the relations shown in list views."""
+        for attribute in INDEXED_RELATIONS:
+            self.user_index(attribute).prepare()
+    
+    def records_between(self, attribute, start=None, end=None):
+        """
+        Get the records of a relation dated within a range.
+        
+        The range is looked up in the relation's time index with two binary
+        searches, instead of checking the date of every record.
+        
+        Args:
+            attribute (str): Name of the relation attribute
+            start (int, optional): First epoch second of the range; open if None
+            end (int, optional): Epoch second after the range; open if None
+            
+        Returns:
+            UserStore: The matching records, oldest first
+        """
+        index = self.user_index(attribute)
+        return index.store.take(index.between(start, end))
+    
+    def recent_records(self, attribute, days, now=None):
+        """
+        Get the records of a relation dated within the last days.
+        
+        Args:
+            attribute (str): Name of the relation attribute
+            days (int): Number of days to look back
+            now (datetime, optional): End of the range; defaults to now
+            
+        Returns:
+            UserStore: The matching records, oldest first
+        """
+        end = export_timestamp(now or datetime.now())
+        return self.records_between(attribute, end - days * SECONDS_PER_DAY, end + 1)
+    
     def find_non_followers(self):
         """
         Find people you follow who don't follow you back.
         
         Returns:
-            list: List of non-followers
+            UserStore: Users you follow who don't follow you back
         """
-        follower_usernames = {follower["username"].lower() for follower in self.followers}
+        follower_usernames = {username.lower() for username in self.followers.usernames()}
         
         # Find users you follow who aren't in your followers list
-        self.non_followers = [
-            user for user in self.following 
-            if user["username"].lower() not in follower_usernames
-        ]
+        self.non_followers = self.following.take(
+            index for index, username in enumerate(self.following.usernames())
+            if username.lower() not in follower_usernames
+        )
         
         logger.info(f"Found {len(self.non_followers)} non-followers")
-        return self.non_followers
\ No newline at end of file
+        return self.non_followers
+
+class _RelationMerger:
+    """
+    Merge parsed records into a parser's relation stores.
+    
+    Records from successive files of the same relation are appended,
+    skipping usernames (case-insensitively) that were already merged.
+    """
+    
+    def __init__(self, parser, attributes):
+        """
+        Initialize the merger and clear the relations it will fill.
+        
+        Args:
+            parser (InstagramDataParser): Parser whose relations are filled
+            attributes (list): Names of the relation attributes to merge into
+        """
+        self.parser = parser
+        self.attributes = set(attributes)
+        self.reset()
+    
+    def reset(self):
+        """Clear the merged relations and the files that failed to parse into them."""
+        self.parser.failed_files = []
+        self.seen = {attribute: set() for attribute in self.attributes}
+        for attribute in self.attributes:
+            setattr(self.parser, attribute, UserStore(self.parser.username_pool))
+    
+    def merge(self, attribute, records):
+        """
+        Append records to a relation, dropping duplicate usernames.
+        
+        Args:
+            attribute (str): Name of the relation attribute
+            records (list): Parsed user records
+        """
+        seen = self.seen[attribute]
+        target = getattr(self.parser, attribute)
+        for record in records:
+            key = record["username"].lower()
+            if key not in seen:
+                seen.add(key)
+                target.append(record["username"], record["url"], record["timestamp"])
+
+class _ByteProgress:
+    """
+    Import progress measured in uncompressed bytes parsed.
+    
+    Parsing takes roughly as long as the file is big, so weighting the
+    members by size keeps the progress bar moving at a steady pace between
+    10% and 90%, whatever the mix of small and large files.
+    """
+    
+    def __init__(self, members, report):
+        """
+        Initialize the progress.
+        
+        Args:
+            members (list): ``(member_name, attribute, description, size)`` tuples
+            report (callable): Progress reporter taking ``(percent, message)``
+        """
+        self.total = sum(member[3] for member in members) or 1
+        self.done = 0
+        self._report = report
+    
+    def advance(self, member):
+        """Count a member as parsed."""
+        self.done += member[3]
+    
+    def restart(self):
+        """Count every member as not parsed yet."""
+        self.done = 0
+    
+    def report(self, message):
+        """
+        Report the current progress.
+        
+        Args:
+            message (str): Status message to display
+        """
+        self._report(10 + 80 * min(self.done, self.total) / self.total, message)
+
+class _CancellableStream:
+    """
+    Text stream wrapper that stops reading once an import is cancelled.
+    
+    The extraction backends read their input in chunks, so checking the
+    cancel event on every read bounds the work done after cancellation to
+    one chunk.
+    """
+    
+    def __init__(self, stream, cancel_event):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            stream (file): Text stream to read from
+            cancel_event (threading.Event): Event checked before each read, or None
+        """
+        self.stream = stream
+        self.cancel_event = cancel_event
+        self.name = getattr(stream, 'name', None)
+    
+    def read(self, size=-1):
+        """Read from the wrapped stream unless the import was cancelled."""
+        _check_cancelled(self.cancel_event)
+        return self.stream.read(size)
+
+def _check_cancelled(cancel_event):
+    """
+    Stop the current import if it has been cancelled.
+    
+    Args:
+        cancel_event (threading.Event): The import's cancel event, or None
+        
+    Raises:
+        ImportCancelled: If the event is set
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        raise ImportCancelled()
+
+def _member_path(extract_dir, member_name):
+    """
+    Map a member name to its path under the extraction directory.
+    
+    Like ``ZipFile.extract``, drive letters and ".." components are dropped,
+    so no member can be written outside the directory.
+    
+    Args:
+        extract_dir (str): Directory to extract files to
+        member_name (str): Name of the member
+        
+    Returns:
+        str: Path to extract the member to, or None if the name is empty
+    """
+    name = os.path.splitdrive(member_name.replace("\\", "/"))[1]
+    parts = [part for part in name.split("/") if part not in ("", ".", "..")]
+    return os.path.join(extract_dir, *parts) if parts else None
+
+def _is_extracted(info, path):
+    """
+    Tell whether a file on disk already holds a member's contents.
+    
+    Args:
+        info (zipfile.ZipInfo): The member
+        path (str): Path the member is extracted to
+        
+    Returns:
+        bool: True if the file has the member's size and CRC-32
+    """
+    try:
+        if os.path.getsize(path) != info.file_size:
+            return False
+        crc = 0
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(EXTRACT_CHUNK_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc == info.CRC
+    except OSError:
+        return False
+
+def _extract_member(zip_ref, info, path):
+    """
+    Extract one member unless it is already on disk, on an extraction thread.
+    
+    ``zipfile`` serializes the reads of the shared archive file, while the
+    decompression and the writes run in parallel.
+    
+    Args:
+        zip_ref (zipfile.ZipFile): The open export archive
+        info (zipfile.ZipInfo): The member to extract
+        path (str): Path to extract the member to
+        
+    Returns:
+        bool: True if the member was written, False if it was up to date
+    """
+    if _is_extracted(info, path):
+        return False
+    with zip_ref.open(info) as source, open(path, 'wb') as target:
+        for chunk in iter(lambda: source.read(EXTRACT_CHUNK_SIZE), b""):
+            target.write(chunk)
+    return True
+
+# Cancel event of the import a worker process parses for, set by _init_parse_worker
+_worker_cancel_event = None
+
+def _init_parse_worker(cancel_event):
+    """
+    Set up a parser worker process.
+    
+    Args:
+        cancel_event (multiprocessing.Event): Set by the parent process to
+            stop the member being parsed
+    """
+    global _worker_cancel_event
+    _worker_cancel_event = cancel_event
+
+def _parse_zip_member_worker(zip_path, member_name, backend):
+    """
+    Parse a single export member in a worker process.
+    
+    Args:
+        zip_path (str): Path to the Instagram data zip file
+        member_name (str): Name of the member to parse
+        backend (str): HTML extraction backend to use
+        
+    Returns:
+        tuple: ``(records, failed_files, started, seconds, process)`` with the
+            parsed user records, the member if it couldn't be parsed, the start
+            time as epoch seconds, the parse time and the worker's process id
+            
+    Raises:
+        ImportCancelled: If the parent process cancelled the import
+    """
+    import zipfile
+    
+    started = time.time()
+    clock = time.perf_counter()
+    parser = InstagramDataParser(backend)
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        records = parser.parse_zip_member(zip_ref, member_name, _worker_cancel_event)
+    return records, parser.failed_files, started, time.perf_counter() - clock, os.getpid()
@@ -0,0 +1,234 @@
+"""
+Export Index Module
+
+This module knows where an Instagram data export keeps its connection
+files, and finds them in an archive's member list in a single pass. It
+also decides which members are worth extracting to disk.
+"""
+
+import re
+import logging
+import fnmatch
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+# Location of the connection files inside an Instagram data export
+CONNECTIONS_DIR = "connections/followers_and_following"
+FOLLOW_REQUESTS_FILE = "follow_requests_you've_received.html"
+PENDING_REQUESTS_FILE = "pending_follow_requests.html"
+# Followers and following are split into numbered shards in large (and
+# recent) exports; older exports have a single unnumbered file
+FOLLOWERS_FILE_PATTERN = re.compile(r"followers(?:_(\d+))?\.html")
+FOLLOWING_FILE_PATTERN = re.compile(r"following(?:_(\d+))?\.html")
+# The same files in exports requested in JSON format
+FOLLOW_REQUESTS_JSON_FILE = "follow_requests_you've_received.json"
+PENDING_REQUESTS_JSON_FILE = "pending_follow_requests.json"
+FOLLOWERS_JSON_FILE_PATTERN = re.compile(r"followers(?:_(\d+))?\.json")
+FOLLOWING_JSON_FILE_PATTERN = re.compile(r"following(?:_(\d+))?\.json")
+
+# Connection files of an export, by format
+ExportLayout = namedtuple("ExportLayout", ["follow_requests", "pending_requests", "followers", "following"])
+EXPORT_LAYOUTS = {
+    "html": ExportLayout(FOLLOW_REQUESTS_FILE, PENDING_REQUESTS_FILE,
+                         FOLLOWERS_FILE_PATTERN, FOLLOWING_FILE_PATTERN),
+    "json": ExportLayout(FOLLOW_REQUESTS_JSON_FILE, PENDING_REQUESTS_JSON_FILE,
+                         FOLLOWERS_JSON_FILE_PATTERN, FOLLOWING_JSON_FILE_PATTERN),
+}
+
+# Layout fields naming a single file, and those matching numbered shards
+SINGLE_FILES = ("follow_requests", "pending_requests")
+SHARDED_FILES = ("followers", "following")
+
+# Every connection file's name starts with one of these
+CONNECTION_FILE_PREFIXES = ("follow", "pending")
+
+# Members not extracted by default: photos and videos, and the files
+# attached to messages, which make up almost all of a large export
+DEFAULT_EXTRACT_EXCLUDE = (
+    "media/*",
+    "*messages/inbox/*/photos/*",
+    "*messages/inbox/*/videos/*",
+    "*messages/inbox/*/audio/*",
+    "*messages/inbox/*/gifs/*",
+    "*messages/inbox/*/files/*",
+)
+
+class ExportIndex:
+    """
+    Lookup tables over the members of an export archive.
+    
+    Built once from the archive's central directory (``ZipFile.infolist``,
+    which ``zipfile`` reads when the archive is opened), so locating a file
+    is a dict lookup however many photos and messages the export holds.
+    Each connection file is recorded for both formats as the members go by;
+    where a file exists more than once, the copy in ``CONNECTIONS_DIR`` wins.
+    """
+    
+    def __init__(self, infos):
+        """
+        Build the index.
+        
+        Args:
+            infos (iterable): ``zipfile.ZipInfo`` of every member
+        """
+        self.sizes = {}
+        # Basename to member name, preferring the usual directory
+        self._by_basename = {}
+        usual_prefix = f"{CONNECTIONS_DIR}/"
+        # Format to layout field to (shard number, member name) pairs
+        self._connections = {export_format: {field: [] for field in ExportLayout._fields}
+                             for export_format in EXPORT_LAYOUTS}
+                             
+        for info in infos:
+            name = info.filename
+            if name.endswith("/"):
+                continue
+            self.sizes[name] = info.file_size
+            basename = name.rpartition("/")[2]
+            if basename not in self._by_basename or name.startswith(usual_prefix):
+                self._by_basename[basename] = name
+            
+            # Photos, messages etc. are ruled out by their name alone
+            if not basename.startswith(CONNECTION_FILE_PREFIXES):
+                continue
+            export_format = basename.rpartition(".")[2].lower()
+            layout = EXPORT_LAYOUTS.get(export_format)
+            if layout is None:
+                continue
+            connections = self._connections[export_format]
+            for field in SINGLE_FILES:
+                if basename == getattr(layout, field):
+                    connections[field].append((0, name))
+            for field in SHARDED_FILES:
+                match = getattr(layout, field).fullmatch(basename)
+                if match:
+                    connections[field].append((int(match.group(1) or 0), name))
+                    
+        json_files = self._connections["json"]
+        self.export_format = "json" if json_files["followers"] or json_files["following"] else "html"
+        self.layout = EXPORT_LAYOUTS[self.export_format]
+    
+    @classmethod
+    def from_zip(cls, zip_ref):
+        """
+        Build the index of an open export archive.
+        
+        Args:
+            zip_ref (zipfile.ZipFile): The open export archive
+            
+        Returns:
+            ExportIndex: The index
+        """
+        return cls(zip_ref.infolist())
+    
+    def __len__(self):
+        """Return the number of files in the archive."""
+        return len(self.sizes)
+    
+    def size(self, member_name):
+        """Return the uncompressed size of a member in bytes."""
+        return self.sizes[member_name]
+    
+    def find(self, basename):
+        """
+        Locate any file of the archive by its basename.
+        
+        Args:
+            basename (str): File name without directories
+            
+        Returns:
+            str: The member name, preferring ``CONNECTIONS_DIR``, or None if
+                the archive doesn't contain the file
+        """
+        return self._by_basename.get(basename)
+    
+    def _preferred(self, field):
+        """Return the entries of a layout field, those in the usual directory if any, in order."""
+        entries = self._connections[self.export_format][field]
+        preferred = [entry for entry in entries if entry[1].startswith(f"{CONNECTIONS_DIR}/")]
+        return sorted(preferred or entries)
+    
+    def member(self, field):
+        """
+        Locate a single connection file in the export's format.
+        
+        Args:
+            field (str): One of ``SINGLE_FILES``, e.g. "follow_requests"
+            
+        Returns:
+            str: The member name, or None if the archive doesn't contain the file
+        """
+        entries = self._preferred(field)
+        if not entries:
+            return None
+        if not entries[0][1].startswith(f"{CONNECTIONS_DIR}/"):
+            logger.info(f"Found {getattr(self.layout, field)} at: {entries[0][1]}")
+        return entries[0][1]
+    
+    def shards(self, field):
+        """
+        Locate all shards of a split connection file in the export's format.
+        
+        Args:
+            field (str): One of ``SHARDED_FILES``, e.g. "followers"
+            
+        Returns:
+            list: Member names of the shards, in shard order
+        """
+        return [name for _, name in self._preferred(field)]
+
+class ExtractManifest:
+    """
+    Which members of an export to extract.
+    
+    A member is extracted if its name matches one of the ``include`` glob
+    patterns and none of the ``exclude`` ones. Patterns are matched against
+    the full member name, and ``*`` also matches across directories.
+    """
+    
+    def __init__(self, include=("*",), exclude=DEFAULT_EXTRACT_EXCLUDE):
+        """
+        Initialize the manifest.
+        
+        Args:
+            include (iterable): Glob patterns of the members to extract
+            exclude (iterable): Glob patterns of members to leave out anyway
+        """
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self._include = self._compile(self.include)
+        self._exclude = self._compile(self.exclude)
+    
+    @staticmethod
+    def _compile(patterns):
+        """Combine glob patterns into one regular expression, or None if there are none."""
+        if not patterns:
+            return None
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+    
+    def wants(self, member_name):
+        """
+        Tell whether a member should be extracted.
+        
+        Args:
+            member_name (str): Name of the member
+            
+        Returns:
+            bool: True if the member is included and not excluded
+        """
+        if self._include is None or not self._include.match(member_name):
+            return False
+        return self._exclude is None or not self._exclude.match(member_name)
+    
+    def select(self, infos):
+        """
+        Pick the files to extract.
+        
+        Args:
+            infos (iterable): ``zipfile.ZipInfo`` of every member
+            
+        Returns:
+            list: ``zipfile.ZipInfo`` of the wanted files, directories left out
+        """
+        return [info for info in infos if not info.filename.endswith("/") and self.wants(info.filename)]
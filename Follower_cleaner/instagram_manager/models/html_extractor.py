@@ -0,0 +1,392 @@
+"""
+HTML Record Extractor Module
+
+This module extracts user records from the connection HTML files of an
+Instagram data export.
+
+Each user in those files is a ``div._a6-p`` block holding the profile link
+and, for requests, the date:
+
+    <div class="_a6-p"><div>
+      <div><a href="https://www.instagram.com/username">username</a></div>
+      <div>Jan 05, 2024, 3:12 PM</div>
+    </div></div>
+
+Two backends are available: a streaming extractor that recognises this
+structure in a single forward scan without building a document tree, and
+a BeautifulSoup selector path, kept as a fallback. Both emit each record's
+username, URL and date together from its own block.
+
+Files on disk can also be scanned by a third backend that memory-maps the
+file and finds the record blocks in the raw bytes, decoding only the
+username, href and date slices.
+"""
+
+import os
+import re
+import html
+import mmap
+import logging
+from html.parser import HTMLParser
+
+logger = logging.getLogger(__name__)
+
+# Class marking a user record block in the export HTML
+RECORD_CLASS = "_a6-p"
+
+# Default number of characters fed to the streaming extractor at a time
+CHUNK_SIZE = 64 * 1024
+
+# Byte patterns used by the memory-mapped scanner
+_CLASS_ATTRIBUTE = re.compile(rb"""class\s*=\s*(["'])(.*?)\1""", re.S | re.I)
+_HREF_ATTRIBUTE = re.compile(rb"""href\s*=\s*(["'])(.*?)\1""", re.S | re.I)
+_DATE_ELEMENT = re.compile(rb"\s*<div(?=[\s/>])[^>]*>(.*?)</div", re.S | re.I)
+_DIV_TAG = re.compile(rb"<(/?)div(?=[\s/>])", re.I)
+_DIV_END_TAG = re.compile(rb"</div(?=[\s/>])", re.I)
+_ANCHOR_START_TAG = re.compile(rb"<a(?=[\s/>])", re.I)
+_ANCHOR_END_TAG = re.compile(rb"</a(?=[\s/>])", re.I)
+_TAG = re.compile(rb"<[^>]*>")
+
+# Elements that never have an end tag
+VOID_ELEMENTS = frozenset([
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+])
+
+def make_record(text, href, date_str):
+    """
+    Build a user record from the raw values of one record block.
+    
+    Args:
+        text (str): Text of the profile link
+        href (str): The link's href, or None if it has none
+        date_str (str): Text of the date element, or "" if there is none
+        
+    Returns:
+        dict: The user record, or None if no username could be found
+    """
+    username = text.strip()
+    
+    # Extract username from URL as fallback
+    if not username and href and "instagram.com/" in href:
+        username = href.split("instagram.com/")[1].strip()
+        if username.endswith("/"):
+            username = username[:-1]
+            
+    if not username:
+        return None
+        
+    return {
+        "username": username,
+        "url": href if href is not None else f"https://www.instagram.com/{username}/",
+        "timestamp": date_str.strip()
+    }
+
+class ConnectionRecordExtractor(HTMLParser):
+    """
+    Streaming extractor for the ``div._a6-p`` record structure.
+    
+    The extractor is a small state machine driven by ``HTMLParser`` events.
+    It matches the same elements as the selectors ``div._a6-p div div a``
+    (profile links) and ``div._a6-p div div:nth-of-type(2)`` (dates), but
+    pairs them within each record block. Completed records are buffered
+    until collected with ``pop_records``, so input can be fed in chunks.
+    """
+    
+    def __init__(self):
+        """Initialize the extractor with no open elements."""
+        super().__init__(convert_charrefs=True)
+        self._records = []
+        # Open elements as [tag, role, number of div children seen]
+        self._stack = []
+        self._in_block = False
+        self._div_depth = 0
+        self._anchor_text = None
+        self._date_text = None
+        self._anchors = []
+        self._dates = []
+    
+    def handle_starttag(self, tag, attrs):
+        """Track record blocks, profile links and date elements."""
+        if tag in VOID_ELEMENTS:
+            return
+            
+        role = None
+        if tag == "div":
+            if self._stack:
+                self._stack[-1][2] += 1
+                
+            if not self._in_block:
+                classes = (dict(attrs).get("class") or "").split()
+                if RECORD_CLASS in classes:
+                    role = "block"
+                    self._in_block = True
+                    self._div_depth = 0
+                    self._anchors = []
+                    self._dates = []
+            else:
+                self._div_depth += 1
+                role = "div"
+                if (self._div_depth >= 2 and self._date_text is None
+                        and self._stack[-1][2] == 2):
+                    role = "date"
+                    self._date_text = []
+        elif tag == "a" and self._in_block and self._div_depth >= 2 and self._anchor_text is None:
+            role = "anchor"
+            self._anchor_text = []
+            self._anchors.append([None, dict(attrs).get("href")])
+            
+        self._stack.append([tag, role, 0])
+    
+    def handle_endtag(self, tag):
+        """Close elements up to the matching start tag."""
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+            
+        while len(self._stack) > index:
+            self._close(self._stack.pop()[1])
+    
+    def handle_data(self, data):
+        """Collect text inside profile links and date elements."""
+        if self._anchor_text is not None:
+            self._anchor_text.append(data)
+        if self._date_text is not None:
+            self._date_text.append(data)
+    
+    def _close(self, role):
+        """
+        Finish an element that was tracked with the given role.
+        
+        Args:
+            role (str): Role assigned when the element was opened
+        """
+        if role == "anchor":
+            self._anchors[-1][0] = "".join(self._anchor_text)
+            self._anchor_text = None
+        elif role in ("div", "date"):
+            self._div_depth -= 1
+            if role == "date":
+                self._dates.append("".join(self._date_text))
+                self._date_text = None
+        elif role == "block":
+            self._in_block = False
+            for i, (text, href) in enumerate(self._anchors):
+                date_str = self._dates[i] if i < len(self._dates) else ""
+                record = make_record(text or "", href, date_str)
+                if record:
+                    self._records.append(record)
+    
+    def pop_records(self):
+        """
+        Return and clear the records completed so far.
+        
+        Returns:
+            list: List of dictionaries containing user data
+        """
+        records = self._records
+        self._records = []
+        return records
+
+def iter_records(stream, chunk_size=CHUNK_SIZE):
+    """
+    Stream user records out of a connection HTML file.
+    
+    Args:
+        stream (file): Text stream of the HTML file
+        chunk_size (int): Number of characters to read at a time
+        
+    Yields:
+        dict: User records in document order
+    """
+    extractor = ConnectionRecordExtractor()
+    for chunk in iter(lambda: stream.read(chunk_size), ""):
+        extractor.feed(chunk)
+        yield from extractor.pop_records()
+    extractor.close()
+    yield from extractor.pop_records()
+
+def extract_records_bs4(stream):
+    """
+    Extract user records with BeautifulSoup CSS selectors.
+    
+    The document is walked once for the record blocks; the profile link and
+    date are then looked up inside each block, so they are emitted together
+    and a record without a date can't shift the dates of the records after it.
+    
+    Args:
+        stream (file): Text stream of the HTML file
+        
+    Returns:
+        list: List of dictionaries containing user data
+    """
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(stream.read(), 'html.parser')
+    
+    results = []
+    for block in soup.select(f"div.{RECORD_CLASS}"):
+        links = block.select(":scope div div a")
+        dates = block.select(":scope div div:nth-of-type(2)")
+        for i, link in enumerate(links):
+            date_str = dates[i].text if i < len(dates) else ""
+            record = make_record(link.text, link.get('href'), date_str)
+            if record:
+                results.append(record)
+    return results
+
+def _decode_text(raw):
+    """
+    Decode a text slice of the raw file the way ``HTMLParser`` reports it.
+    
+    Args:
+        raw (bytes): UTF-8 bytes, possibly with tags and character references
+        
+    Returns:
+        str: The text content
+    """
+    if b"<" in raw:
+        raw = _TAG.sub(b"", raw)
+    return html.unescape(raw.decode('utf-8', errors='replace'))
+
+def _is_tag(buffer, position, name):
+    """Check whether a start or end tag with the given name begins at a position."""
+    end = position + len(name)
+    return (buffer[position:end].lower() == name
+            and buffer[end:end + 1] in (b" ", b"\t", b"\n", b"\r", b">", b"/"))
+
+def _find_block_starts(buffer):
+    """
+    Find the start tags of the record blocks in a raw HTML buffer.
+    
+    Args:
+        buffer (mmap.mmap or bytes): The raw file
+        
+    Yields:
+        tuple: ``(tag_start, content_start)`` of each ``div._a6-p`` start tag
+    """
+    marker = RECORD_CLASS.encode()
+    position = 0
+    while True:
+        hit = buffer.find(marker, position)
+        if hit < 0:
+            return
+        position = hit + len(marker)
+        tag_start = buffer.rfind(b"<", 0, hit)
+        tag_end = buffer.find(b">", hit)
+        if tag_start < 0 or tag_end < 0 or buffer.rfind(b">", tag_start, hit) >= 0:
+            continue
+        if not _is_tag(buffer, tag_start, b"<div"):
+            continue
+        classes = _CLASS_ATTRIBUTE.search(buffer, tag_start, tag_end)
+        if classes and marker in classes.group(2).split():
+            yield tag_start, tag_end + 1
+
+def _find_block_end(buffer, tag_start):
+    """
+    Find the end of a record block by matching its nested divs.
+    
+    Args:
+        buffer (mmap.mmap or bytes): The raw file
+        tag_start (int): Offset of the block's start tag
+        
+    Returns:
+        int: Offset just past the block's end tag, or the end of the buffer
+    """
+    depth = 0
+    for tag in _DIV_TAG.finditer(buffer, tag_start):
+        if not tag.group(1):
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            end = buffer.find(b">", tag.end())
+            return len(buffer) if end < 0 else end + 1
+    return len(buffer)
+
+def _scan_block(buffer, start, end):
+    """
+    Extract the records of one block from the raw bytes.
+    
+    Each profile link is paired with the date held by the div following
+    the link's own div, as in the block layout described above. Tag names
+    are matched in any case, as ``HTMLParser`` does.
+    
+    Args:
+        buffer (mmap.mmap or bytes): The raw file
+        start (int): Offset of the block's content
+        end (int): Offset of the block's end
+        
+    Returns:
+        list: List of dictionaries containing user data
+    """
+    records = []
+    position = start
+    while True:
+        anchor = _ANCHOR_START_TAG.search(buffer, position, end)
+        if anchor is None:
+            return records
+        tag_end = buffer.find(b">", anchor.start(), end)
+        close = _ANCHOR_END_TAG.search(buffer, tag_end, end) if tag_end >= 0 else None
+        if close is None:
+            return records
+            
+        href = _HREF_ATTRIBUTE.search(buffer, anchor.start(), tag_end)
+        date = b""
+        div_close = _DIV_END_TAG.search(buffer, close.end(), end)
+        if div_close is not None:
+            date_start = buffer.find(b">", div_close.end(), end)
+            if date_start >= 0:
+                date_match = _DATE_ELEMENT.match(buffer, date_start + 1, end)
+                if date_match:
+                    date = date_match.group(1)
+                    
+        record = make_record(_decode_text(buffer[tag_end + 1:close.start()]),
+                             _decode_text(href.group(2)) if href else None,
+                             _decode_text(date))
+        if record:
+            records.append(record)
+        position = close.end()
+
+def iter_file_records(file_path):
+    """
+    Stream user records out of a connection HTML file on disk.
+    
+    The file is memory-mapped and scanned as bytes: record blocks are found
+    by their class marker and matched up to their closing div, and only the
+    username, href and date slices are decoded. No decoded copy of the file
+    is made, so memory stays close to the size of the records themselves.
+    
+    Args:
+        file_path (str): Path to the HTML file
+        
+    Yields:
+        dict: User records in document order
+    """
+    if os.path.getsize(file_path) == 0:
+        return
+        
+    with open(file_path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        position = 0
+        for tag_start, content_start in _find_block_starts(buffer):
+            # Blocks nested in an already scanned block are part of it
+            if tag_start < position:
+                continue
+            position = _find_block_end(buffer, tag_start)
+            yield from _scan_block(buffer, content_start, position)
+
+# Extraction backends selectable on InstagramDataParser; "mmap" reads
+# text streams (e.g. ZIP members) with the streaming extractor
+BACKENDS = {
+    "stream": lambda stream: list(iter_records(stream)),
+    "bs4": extract_records_bs4,
+    "mmap": lambda stream: list(iter_records(stream)),
+}
+
+# Backends that scan files on disk directly rather than a text stream
+FILE_BACKENDS = {
+    "mmap": iter_file_records,
+}
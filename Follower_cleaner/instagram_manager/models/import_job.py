@@ -0,0 +1,184 @@
+"""
+Import Job Module
+
+This module runs imports of Instagram data exports in the background,
+one at a time, with cooperative cancellation.
+"""
+
+import logging
+import threading
+
+from instagram_manager.models.data_parser import InstagramDataParser, ImportCancelled
+from instagram_manager.utils.instrumentation import ImportTrace
+
+logger = logging.getLogger(__name__)
+
+class ImportJob:
+    """
+    A single import of an export ZIP.
+    
+    Each job parses into its own ``InstagramDataParser``, so a job that is
+    cancelled or superseded never touches the data the UI is showing.
+    The job's ``trace`` records the time spent in every stage.
+    """
+    
+    def __init__(self, job_id, zip_path):
+        """
+        Initialize the job.
+        
+        Args:
+            job_id (int): Sequence number of the job
+            zip_path (str): Path to the Instagram data export ZIP
+        """
+        self.job_id = job_id
+        self.zip_path = zip_path
+        self.cancel_event = threading.Event()
+        self.parser = InstagramDataParser()
+        self.trace = ImportTrace(zip_path)
+    
+    @property
+    def cancelled(self):
+        """Whether the job has been cancelled."""
+        return self.cancel_event.is_set()
+    
+    def cancel(self):
+        """Ask the job to stop at its next cancellation point."""
+        self.cancel_event.set()
+
+class ImportJobManager:
+    """
+    Runs import jobs with at most one active job.
+    
+    Starting an import cancels the running one; the old job stops at its
+    next cancellation point (between files, or at the next chunk read from
+    the file being parsed) while the new one starts right away. Only the
+    active job reports progress and results, so a superseded job can never
+    overwrite the status or the data of its replacement.
+    
+    The callbacks are called from the job's thread; they should hand the
+    work over to the UI thread (e.g. through an ``EventChannel``).
+    """
+    
+    def __init__(self, on_progress=None, on_done=None, on_error=None, parse_cache=None):
+        """
+        Initialize the manager.
+        
+        Args:
+            on_progress (callable, optional): Called as ``on_progress(percent, message)``
+            on_done (callable, optional): Called as ``on_done(job)`` with the
+                finished job; its parsed data is in ``job.parser``
+            on_error (callable, optional): Called as ``on_error(message, exception)``
+            parse_cache (ParseCache, optional): Cache of previously parsed exports
+        """
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.parse_cache = parse_cache
+        self._lock = threading.Lock()
+        self._active = None
+        self._next_id = 1
+    
+    @property
+    def active(self):
+        """The running job, or None."""
+        return self._active
+    
+    def start(self, zip_path):
+        """
+        Start importing an export, superseding any running import.
+        
+        Args:
+            zip_path (str): Path to the Instagram data export ZIP
+            
+        Returns:
+            ImportJob: The new job
+        """
+        with self._lock:
+            if self._active is not None:
+                logger.info(f"Import job {self._active.job_id} superseded")
+                self._active.cancel()
+            job = ImportJob(self._next_id, zip_path)
+            self._next_id += 1
+            self._active = job
+            
+        logger.info(f"Starting import job {job.job_id} for {zip_path}")
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+        return job
+    
+    def cancel(self):
+        """
+        Cancel the running import, if any.
+        
+        Returns:
+            bool: True if a job was cancelled
+        """
+        with self._lock:
+            job, self._active = self._active, None
+        if job is None:
+            return False
+            
+        logger.info(f"Import job {job.job_id} cancelled")
+        job.cancel()
+        return True
+    
+    def _run(self, job):
+        """
+        Background process running one job.
+        
+        Args:
+            job (ImportJob): The job to run
+        """
+        def report(percent, message):
+            self._notify(job, self.on_progress, percent, message)
+            
+        try:
+            success = job.parser.parse_zip(job.zip_path, progress_callback=report,
+                                           cache=self.parse_cache, cancel_event=job.cancel_event,
+                                           trace=job.trace)
+        except ImportCancelled:
+            logger.info(f"Import job {job.job_id} stopped")
+            return
+        except Exception as e:
+            logger.error(f"Error in import job {job.job_id}: {e}", exc_info=True)
+            self._finish(job, self.on_error, f"Failed to process data: {str(e)}", e)
+            return
+            
+        if success:
+            # Indexes are built here so the UI thread only has to look them up
+            with job.trace.span("build_indexes", "index"):
+                job.parser.build_indexes()
+            self._finish(job, self.on_done, job)
+        else:
+            self._finish(job, self.on_error, "Failed to read ZIP file", None)
+    
+    def _notify(self, job, callback, *args):
+        """
+        Call a callback on behalf of a job if it is still the active one.
+        
+        The check and the call happen under the lock, so once ``start`` or
+        ``cancel`` has returned the old job can't report anything more.
+        
+        Args:
+            job (ImportJob): The reporting job
+            callback (callable): Callback to call, or None
+            *args: Arguments for the callback
+        """
+        with self._lock:
+            if job is self._active and callback:
+                callback(*args)
+    
+    def _finish(self, job, callback, *args):
+        """
+        Report a job's outcome and retire it if it is still the active one.
+        
+        Args:
+            job (ImportJob): The finished job
+            callback (callable): Callback to call, or None
+            *args: Arguments for the callback
+        """
+        with self._lock:
+            if job is not self._active:
+                return
+            self._active = None
+            if callback:
+                callback(*args)
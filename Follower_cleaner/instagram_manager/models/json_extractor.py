@@ -0,0 +1,224 @@
+"""
+JSON Record Extractor Module
+
+This module extracts user records from the connection JSON files of an
+Instagram data export.
+
+Each user in those files is an entry holding a ``string_list_data`` list
+with the profile link, username and date (as epoch seconds):
+
+    {"title": "", "media_list_data": [], "string_list_data": [
+      {"href": "https://www.instagram.com/username", "value": "username",
+       "timestamp": 1704467520}
+    ]}
+
+The entries are either the top-level list of the file (followers) or the
+list under its first key (e.g. ``relationships_following``). Newer exports
+put the username in the entry's ``title`` instead of ``value``.
+
+Entries are decoded one at a time from a sliding buffer, so the whole file
+is never loaded or decoded at once.
+"""
+
+import json
+import logging
+
+from instagram_manager.models.html_extractor import CHUNK_SIZE, make_record
+from instagram_manager.models.user_store import local_export_timestamp
+
+logger = logging.getLogger(__name__)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+class _JsonReader:
+    """
+    Incremental reader of JSON values from a text stream.
+    
+    Only the unread tail of the input is kept in the buffer; a value that
+    isn't complete yet is decoded again once more input has been read.
+    """
+    
+    def __init__(self, stream, chunk_size):
+        """
+        Initialize the reader.
+        
+        Args:
+            stream (file): Text stream of the JSON file
+            chunk_size (int): Number of characters to read at a time
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+    
+    def _fill(self):
+        """Append the next chunk of input, dropping what was already consumed."""
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+    
+    def peek(self):
+        """
+        Skip whitespace and return the next character without consuming it.
+        
+        Returns:
+            str: The next character, or "" at the end of the input
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._fill()
+    
+    def expect(self, char):
+        """
+        Consume a structural character.
+        
+        Args:
+            char (str): The expected character
+            
+        Raises:
+            ValueError: If the next character is a different one
+        """
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}")
+        self.pos += 1
+    
+    def decode(self):
+        """
+        Decode the next complete JSON value.
+        
+        Returns:
+            object: The decoded value
+            
+        Raises:
+            ValueError: If the input is not valid JSON
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill()
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and not self.eof:
+                self._fill()
+                continue
+            self.pos = end
+            return value
+    
+    def iter_list(self):
+        """
+        Decode the items of the list starting at the current position.
+        
+        Yields:
+            object: The list items, one at a time
+        """
+        self.expect("[")
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.pos += 1
+                return
+            if char == ",":
+                self.pos += 1
+                continue
+            if not char:
+                raise ValueError("Unexpected end of JSON list")
+            yield self.decode()
+
+def iter_entries(stream, chunk_size=CHUNK_SIZE):
+    """
+    Stream the user entries out of a connection JSON file.
+    
+    Args:
+        stream (file): Text stream of the JSON file
+        chunk_size (int): Number of characters to read at a time
+        
+    Yields:
+        dict: Entries in file order
+    """
+    reader = _JsonReader(stream, chunk_size)
+    first = reader.peek()
+    if first == "[":
+        yield from reader.iter_list()
+        return
+    if first != "{":
+        raise ValueError("Connection JSON file doesn't contain an object or list")
+        
+    # Use the first list-valued key, skipping any other values before it
+    reader.pos += 1
+    while True:
+        char = reader.peek()
+        if char in ("}", ""):
+            return
+        if char == ",":
+            reader.pos += 1
+            continue
+        key = reader.decode()
+        reader.expect(":")
+        if reader.peek() == "[":
+            logger.debug(f"Reading entries of {key}")
+            yield from reader.iter_list()
+            return
+        reader.decode()
+
+def entry_records(entry):
+    """
+    Build the user records of one entry.
+    
+    Args:
+        entry (dict): Entry of a connection JSON file
+        
+    Returns:
+        list: User records; the timestamps are epoch seconds of the local
+            date and time, as ``local_export_timestamp`` gives, or "" if missing
+    """
+    if not isinstance(entry, dict):
+        return []
+        
+    records = []
+    for item in entry.get("string_list_data") or ():
+        username = item.get("value") or entry.get("title") or ""
+        record = make_record(username, item.get("href"), "")
+        if record:
+            timestamp = item.get("timestamp")
+            timestamp = local_export_timestamp(timestamp) if isinstance(timestamp, int) else None
+            record["timestamp"] = timestamp if timestamp is not None else ""
+            records.append(record)
+    return records
+
+def iter_json_records(stream, chunk_size=CHUNK_SIZE):
+    """
+    Stream user records out of a connection JSON file.
+    
+    Args:
+        stream (file): Text stream of the JSON file
+        chunk_size (int): Number of characters to read at a time
+        
+    Yields:
+        dict: User records in file order
+    """
+    for entry in iter_entries(stream, chunk_size):
+        yield from entry_records(entry)
+
+def extract_records_json(stream):
+    """
+    Extract user records from a connection JSON file.
+    
+    Args:
+        stream (file): Text stream of the JSON file
+        
+    Returns:
+        list: List of dictionaries containing user data
+    """
+    return list(iter_json_records(stream))
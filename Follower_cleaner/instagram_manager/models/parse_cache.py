@@ -0,0 +1,172 @@
+"""
+Parse Cache Module
+
+This module keeps parsed connection data on disk so that re-importing an
+export that was already analysed skips parsing entirely.
+"""
+
+import os
+import json
+import time
+import logging
+
+from instagram_manager.models.user_store import UserStore
+
+logger = logging.getLogger(__name__)
+
+# Bump when the parsed record format changes, or when parsing the same
+# archive gives different records (new file layouts, date formats, ...),
+# so old entries are ignored
+CACHE_FORMAT_VERSION = 5
+
+# Relations stored for each export
+CACHED_RELATIONS = ("follow_requests", "pending_sent_requests", "followers", "following")
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".instagram_manager", "cache")
+
+class ParseCache:
+    """
+    On-disk cache of parsed Instagram data exports.
+    
+    Entries are keyed by a hash of the archive's central directory (member
+    names, CRCs and sizes), which is read when the ZIP is opened anyway, so
+    computing the key costs nothing beyond what the import already does.
+    Each entry is a gzip-compressed JSON file holding the columns of the
+    parsed relations' ``UserStore``s. Least recently used entries are
+    evicted once the cache grows past ``max_bytes``, and entries older than
+    ``max_age_days`` are dropped.
+    """
+    
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=200 * 1024 * 1024, max_age_days=90):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            max_bytes (int): Maximum total size of the cache entries
+            max_age_days (float): Maximum age of an unused entry in days
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+    
+    def archive_key(self, zip_ref):
+        """
+        Compute the cache key of an open export archive.
+        
+        Args:
+            zip_ref (zipfile.ZipFile): The open export archive
+            
+        Returns:
+            str: Hex digest identifying the archive's contents
+        """
+        import hashlib
+        
+        digest = hashlib.sha1(f"v{CACHE_FORMAT_VERSION}".encode())
+        for info in zip_ref.infolist():
+            digest.update(f"{info.filename}\0{info.CRC:08x}\0{info.file_size}\n".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _entry_path(self, key):
+        """Return the path of the cache entry for a key."""
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+    
+    def load(self, key, pool=None):
+        """
+        Load the parsed relations of an export from the cache.
+        
+        Args:
+            key (str): Cache key from ``archive_key``
+            pool (UsernamePool, optional): Pool to intern the usernames in
+            
+        Returns:
+            dict: Relation name to UserStore, or None on a miss
+        """
+        import gzip
+        
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+            
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get("version") != CACHE_FORMAT_VERSION:
+                return None
+                
+            relations = {
+                name: UserStore.from_columns(data["relations"][name], pool)
+                for name in CACHED_RELATIONS
+            }
+            # Mark the entry as recently used for eviction
+            os.utime(path)
+            logger.info(f"Loaded parsed data from cache: {path}")
+            return relations
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+    
+    def store(self, key, relations):
+        """
+        Store the parsed relations of an export in the cache.
+        
+        Args:
+            key (str): Cache key from ``archive_key``
+            relations (dict): Relation name to UserStore
+            
+        Returns:
+            bool: True if the entry was written, False otherwise
+        """
+        import gzip
+        import tempfile
+        
+        path = self._entry_path(key)
+        temp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            data = {
+                "version": CACHE_FORMAT_VERSION,
+                "relations": {name: relations[name].to_columns() for name in CACHED_RELATIONS},
+            }
+            # A unique name, so concurrent imports of the same export don't share a file
+            handle, temp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+            with os.fdopen(handle, 'wb') as raw, \
+                    gzip.open(raw, 'wt', encoding='utf-8', compresslevel=5) as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.replace(temp_path, path)
+            logger.info(f"Stored parsed data in cache: {path}")
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+            
+        self.evict()
+        return True
+    
+    def evict(self):
+        """Remove expired entries and trim the cache to its size limit."""
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json.gz"):
+                    path = os.path.join(self.cache_dir, name)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError as e:
+            logger.warning(f"Failed to scan cache directory {self.cache_dir}: {e}")
+            return
+            
+        # Oldest entries first
+        entries.sort()
+        expiry = time.time() - self.max_age_days * 24 * 60 * 60
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            if mtime >= expiry and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                logger.info(f"Evicted cache entry: {path}")
+            except OSError as e:
+                logger.warning(f"Failed to evict cache entry {path}: {e}")
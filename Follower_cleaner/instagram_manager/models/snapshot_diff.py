@@ -0,0 +1,154 @@
+"""
+Snapshot Diff Module
+
+This module compares two parsed Instagram data exports to find out who
+followed, who unfollowed and what happened to follow requests in between.
+"""
+
+import logging
+from operator import itemgetter
+
+logger = logging.getLogger(__name__)
+
+# Change categories in display order, with their labels
+CHANGE_CATEGORIES = [
+    ("new_followers", "New followers"),
+    ("lost_followers", "Unfollowed you"),
+    ("started_following", "You started following"),
+    ("stopped_following", "You stopped following"),
+    ("sent_requests_accepted", "Your requests that were accepted"),
+    ("sent_requests_withdrawn", "Your requests that were withdrawn or declined"),
+    ("new_sent_requests", "New requests you sent"),
+    ("received_requests_accepted", "Requests you accepted"),
+    ("received_requests_withdrawn", "Requests withdrawn or declined"),
+    ("new_received_requests", "New requests you received"),
+]
+
+def _sorted_by_username(store):
+    """
+    Pair a relation's row indices with their normalized username and sort by it.
+    
+    Args:
+        store (UserStore): User records of one relation
+        
+    Returns:
+        list: ``(normalized_username, index)`` tuples in username order
+    """
+    keyed = [(username.lower(), index) for index, username in enumerate(store.usernames())]
+    keyed.sort(key=itemgetter(0))
+    return keyed
+
+def _merge(left, right):
+    """
+    Walk two username-sorted lists once and split them by membership.
+    
+    Args:
+        left (list): ``(normalized_username, index)`` tuples, sorted
+        right (list): ``(normalized_username, index)`` tuples, sorted
+        
+    Returns:
+        tuple: ``(only_left, only_right, in_both)`` lists of keyed tuples;
+            ``in_both`` holds the tuples from ``left``
+    """
+    only_left, only_right, in_both = [], [], []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        left_key, right_key = left[i][0], right[j][0]
+        if left_key == right_key:
+            in_both.append(left[i])
+            i += 1
+            j += 1
+        elif left_key < right_key:
+            only_left.append(left[i])
+            i += 1
+        else:
+            only_right.append(right[j])
+            j += 1
+    only_left.extend(left[i:])
+    only_right.extend(right[j:])
+    return only_left, only_right, in_both
+
+def _records(store, keyed):
+    """Copy the records referenced by keyed tuples out of a store."""
+    return store.take(index for _, index in keyed)
+
+class SnapshotDiff:
+    """
+    Differences between two parsed Instagram data exports.
+    
+    Each change category from ``CHANGE_CATEGORIES`` is available as an
+    attribute holding a UserStore of the affected users, sorted by username.
+    """
+    
+    def __init__(self, old, new):
+        """
+        Compute the differences between two snapshots.
+        
+        Every relation is sorted once by normalized username and then
+        compared in a single merge pass, so the whole diff is
+        O(n log n) in the size of the snapshots.
+        
+        Args:
+            old (InstagramDataParser): Parser holding the older export
+            new (InstagramDataParser): Parser holding the newer export
+        """
+        new_followers = _sorted_by_username(new.followers)
+        new_following = _sorted_by_username(new.following)
+        
+        lost, gained, _ = _merge(_sorted_by_username(old.followers), new_followers)
+        self.new_followers = _records(new.followers, gained)
+        self.lost_followers = _records(old.followers, lost)
+        
+        stopped, started, _ = _merge(_sorted_by_username(old.following), new_following)
+        self.started_following = _records(new.following, started)
+        self.stopped_following = _records(old.following, stopped)
+        
+        # A sent request that disappeared was accepted if you now follow them
+        resolved, sent, _ = _merge(_sorted_by_username(old.pending_sent_requests),
+                                   _sorted_by_username(new.pending_sent_requests))
+        withdrawn, _, accepted = _merge(resolved, new_following)
+        self.new_sent_requests = _records(new.pending_sent_requests, sent)
+        self.sent_requests_accepted = _records(old.pending_sent_requests, accepted)
+        self.sent_requests_withdrawn = _records(old.pending_sent_requests, withdrawn)
+        
+        # A received request that disappeared was accepted if they now follow you
+        resolved, received, _ = _merge(_sorted_by_username(old.follow_requests),
+                                       _sorted_by_username(new.follow_requests))
+        withdrawn, _, accepted = _merge(resolved, new_followers)
+        self.new_received_requests = _records(new.follow_requests, received)
+        self.received_requests_accepted = _records(old.follow_requests, accepted)
+        self.received_requests_withdrawn = _records(old.follow_requests, withdrawn)
+        
+        logger.info("Snapshot diff: " + ", ".join(
+            f"{len(getattr(self, key))} {key}" for key, _ in CHANGE_CATEGORIES))
+    
+    def categories(self):
+        """
+        List the change categories with their records.
+        
+        Returns:
+            list: ``(key, label, records)`` tuples in display order
+        """
+        return [(key, label, getattr(self, key)) for key, label in CHANGE_CATEGORIES]
+    
+    def total_changes(self):
+        """
+        Count the changes across all categories.
+        
+        Returns:
+            int: Total number of changed records
+        """
+        return sum(len(records) for _, _, records in self.categories())
+
+def diff_snapshots(old, new):
+    """
+    Compare two parsed Instagram data exports.
+    
+    Args:
+        old (InstagramDataParser): Parser holding the older export
+        new (InstagramDataParser): Parser holding the newer export
+        
+    Returns:
+        SnapshotDiff: The differences between the two exports
+    """
+    return SnapshotDiff(old, new)
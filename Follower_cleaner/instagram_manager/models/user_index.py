@@ -0,0 +1,216 @@
+"""
+User Index Module
+
+This module provides prebuilt indexes over the records of a relation, so
+the views can search, filter and sort them without scanning every row.
+"""
+
+import logging
+from array import array
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+# Sorts after any character that can follow a prefix
+_PREFIX_END = "\U0010ffff"
+
+# Columns the rows can be sorted by
+SORT_COLUMNS = ("username", "date")
+
+class UserIndex:
+    """
+    Search index over the usernames of one ``UserStore``.
+    
+    The index is the store's row numbers ordered by case-folded username.
+    Rows whose username starts with a prefix are then one contiguous run,
+    found with two binary searches, and returned as a zero-copy slice, so a
+    lookup costs the same for a hundred users or a million. The case-folded
+    keys themselves are not kept; they are recomputed for the few rows a
+    binary search visits.
+    
+    The ascending order of every sort column is computed once and cached,
+    together with each row's rank in it. A descending order is the
+    ascending one read backwards, and search results are sorted by the
+    precomputed ranks, so changing the sort never sorts the whole store.
+    
+    The date order doubles as a time index: next to it the index keeps the
+    sorted timestamps, so the rows of a date range are found with two
+    binary searches too.
+    """
+    
+    def __init__(self, store):
+        """
+        Build the index.
+        
+        Args:
+            store (UserStore): The records to index
+        """
+        self.store = store
+        usernames = list(store.usernames())
+        self._by_username = array('l', sorted(range(len(usernames)), key=lambda row: usernames[row].casefold()))
+        self._by_username_view = memoryview(self._by_username)
+        self._orders = {"username": self._by_username_view}
+        self._ranks = {}
+        self._sorted_timestamps = None
+    
+    def _key(self, position):
+        """Return the case-folded username at a position of the username order."""
+        return self.store.username(self._by_username[position]).casefold()
+    
+    def _bisect(self, key):
+        """
+        Find the first position of the username order not below a key.
+        
+        Args:
+            key (str): Case-folded key
+            
+        Returns:
+            int: Insertion position of the key
+        """
+        low, high = 0, len(self._by_username)
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def order(self, column):
+        """
+        Get the rows in ascending order of a column, computing it once.
+        
+        Rows with the same date keep their username order; rows without a
+        date come first.
+        
+        Args:
+            column (str): One of ``SORT_COLUMNS``
+            
+        Returns:
+            memoryview: Row numbers of the store
+            
+        Raises:
+            ValueError: If the column can't be sorted by
+        """
+        order = self._orders.get(column)
+        if order is None:
+            if column != "date":
+                raise ValueError(f"Unknown sort column: {column}")
+            timestamps = array('q', self.store.timestamp_values())
+            order = memoryview(array('l', sorted(self._by_username, key=timestamps.__getitem__)))
+            self._sorted_timestamps = array('q', (timestamps[row] for row in order))
+            self._orders[column] = order
+        return order
+    
+    def rank(self, column):
+        """
+        Get the position of every row in the ascending order of a column.
+        
+        Args:
+            column (str): One of ``SORT_COLUMNS``
+            
+        Returns:
+            array: Position in the column's order, indexed by row number
+        """
+        rank = self._ranks.get(column)
+        if rank is None:
+            rank = array('l', bytes(len(self.store) * array('l').itemsize))
+            for position, row in enumerate(self.order(column)):
+                rank[row] = position
+            self._ranks[column] = rank
+        return rank
+    
+    def prepare(self):
+        """Compute the orders and ranks of all sort columns ahead of use."""
+        for column in SORT_COLUMNS:
+            self.rank(column)
+    
+    def _date_positions(self, start, end):
+        """
+        Find the positions of a date range in the date order.
+        
+        Args:
+            start (int, optional): First epoch second of the range; open if None
+            end (int, optional): Epoch second after the range; open if None
+            
+        Returns:
+            tuple: ``(first, last)`` positions; rows without a date are never
+                in the range
+        """
+        self.order("date")
+        timestamps = self._sorted_timestamps
+        first = bisect_left(timestamps, 0 if start is None else max(start, 0))
+        last = len(timestamps) if end is None else max(first, bisect_left(timestamps, end))
+        return first, last
+    
+    def between(self, start=None, end=None):
+        """
+        Find the rows dated within a range.
+        
+        Args:
+            start (int, optional): First epoch second of the range; open if None
+            end (int, optional): Epoch second after the range; open if None
+            
+        Returns:
+            memoryview: Row numbers of the store, oldest first
+        """
+        first, last = self._date_positions(start, end)
+        return self.order("date")[first:last]
+    
+    def search(self, prefix="", column=None, descending=False, start=None, end=None):
+        """
+        Find the rows whose username starts with a prefix, ignoring case.
+        
+        Args:
+            prefix (str): Start of the username; "" matches every row
+            column (str, optional): Column to sort the rows by, one of
+                ``SORT_COLUMNS``; unsorted if not given
+            descending (bool): Whether to sort in descending order
+            start (int, optional): Only rows dated from this epoch second on
+            end (int, optional): Only rows dated before this epoch second
+            
+        Returns:
+            Sequence: Row numbers of the store. Unsorted, these are all rows
+                in store order without a prefix or dates, otherwise the
+                matches in username order, or date order with only dates
+        """
+        prefix = prefix.strip().casefold()
+        dated = start is not None or end is not None
+        if prefix:
+            username_first = self._bisect(prefix)
+            username_last = self._bisect(prefix + _PREFIX_END)
+            
+        if prefix and dated:
+            # Walk the smaller of the two runs and test the other condition by rank
+            date_first, date_last = self._date_positions(start, end)
+            if username_last - username_first <= date_last - date_first:
+                rank = self.rank("date")
+                rows = (row for row in self._by_username_view[username_first:username_last]
+                        if date_first <= rank[row] < date_last)
+                ordered_by = "username"
+            else:
+                rank = self.rank("username")
+                rows = (row for row in self.order("date")[date_first:date_last]
+                        if username_first <= rank[row] < username_last)
+                ordered_by = "date"
+            rows = memoryview(array('l', rows))
+        elif prefix:
+            rows = self._by_username_view[username_first:username_last]
+            ordered_by = "username"
+        elif dated:
+            rows = self.between(start, end)
+            ordered_by = "date"
+        elif column is None:
+            rows = range(len(self.store))
+            ordered_by = None
+        else:
+            rows = self.order(column)
+            ordered_by = column
+            
+        if column is not None and column != ordered_by:
+            # Only the matches are sorted, by their precomputed rank
+            rows = memoryview(array('l', sorted(rows, key=self.rank(column).__getitem__)))
+        if column is not None and descending:
+            # A reversed view of the same rows, not a new sort
+            rows = rows[::-1]
+        return rows
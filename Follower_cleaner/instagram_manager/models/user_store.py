@@ -0,0 +1,362 @@
+"""
+User Store Module
+
+This module provides a compact, column-oriented container for the user
+records of one relation (followers, following, follow requests, ...).
+"""
+
+import re
+import calendar
+import logging
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# Stored timestamp for records without a date
+NO_TIMESTAMP = -1
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# How a record's profile URL relates to its username
+URL_PLAIN = 0      # https://www.instagram.com/<username>
+URL_SLASH = 1      # https://www.instagram.com/<username>/
+URL_EXPLICIT = 2   # Anything else, stored as is
+
+PROFILE_URL_PREFIX = "https://www.instagram.com/"
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Date format of the HTML export, e.g. "Jan 05, 2024, 3:12 PM"
+EXPORT_DATE_PATTERN = re.compile(r"([A-Z][a-z]{2}) (\d{2}), (\d{4}), (\d{1,2}):(\d{2}) ([AP]M)")
+
+# Other date formats seen in exports, for ``datetime.strptime``
+ALTERNATE_DATE_FORMATS = (
+    "%b %d, %Y %I:%M %p",
+    "%b %d, %Y, %I:%M:%S %p",
+    "%B %d, %Y, %I:%M %p",
+    "%d %b %Y, %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+def export_timestamp(moment):
+    """
+    Convert a date and time to epoch seconds the way export dates are stored.
+    
+    The export shows dates without a time zone; they are stored as if they
+    were UTC so that formatting them back gives the original text.
+    
+    Args:
+        moment (datetime): Naive date and time
+        
+    Returns:
+        int: Epoch seconds
+    """
+    return calendar.timegm(moment.timetuple())
+
+def local_export_timestamp(epoch):
+    """
+    Convert a point in time to epoch seconds the way export dates are stored.
+    
+    JSON exports give real epoch seconds, while the HTML export shows local
+    dates and times; both are stored as the local date and time, so they
+    display alike and compare with ``export_timestamp(datetime.now())``.
+    
+    Args:
+        epoch (int): Real epoch seconds
+        
+    Returns:
+        int: Epoch seconds of the local date and time taken as UTC, or None
+            if the value is out of range
+    """
+    try:
+        return export_timestamp(datetime.fromtimestamp(epoch))
+    except (OverflowError, OSError, ValueError):
+        return None
+
+def _parse_default_date(text):
+    """Parse a date in the usual export format, without strptime."""
+    match = EXPORT_DATE_PATTERN.fullmatch(text)
+    if not match or match.group(1) not in MONTHS:
+        return None
+        
+    month, day, year, hour, minute, meridiem = match.groups()
+    hour = int(hour) % 12 + (12 if meridiem == "PM" else 0)
+    try:
+        return export_timestamp(datetime(int(year), MONTHS.index(month) + 1, int(day), hour, int(minute)))
+    except ValueError:
+        return None
+
+def _date_format_parser(date_format):
+    """Build a parser for one of the alternate date formats."""
+    def parse(text):
+        try:
+            return export_timestamp(datetime.strptime(text, date_format))
+        except ValueError:
+            return None
+    return parse
+
+_DATE_PARSERS = [_parse_default_date] + [_date_format_parser(date_format)
+                                         for date_format in ALTERNATE_DATE_FORMATS]
+
+# Index of the parser that matched last; an export uses one format throughout
+_last_date_parser = 0
+
+def parse_export_date(text):
+    """
+    Convert an export date string to epoch seconds.
+    
+    The format that matched the previous date is tried first, so the
+    format is only detected again when it changes, not for every record.
+    
+    Args:
+        text (str): Date as shown in the export
+        
+    Returns:
+        int: Epoch seconds, or None if the text isn't in a known format
+    """
+    global _last_date_parser
+    last = _last_date_parser
+    value = _DATE_PARSERS[last](text)
+    if value is not None:
+        return value
+        
+    for index, parser in enumerate(_DATE_PARSERS):
+        if index != last:
+            value = parser(text)
+            if value is not None:
+                _last_date_parser = index
+                return value
+    return None
+
+def format_export_date(timestamp):
+    """
+    Format epoch seconds the way the export shows dates.
+    
+    Args:
+        timestamp (int): Epoch seconds
+        
+    Returns:
+        str: Date such as "Jan 05, 2024, 3:12 PM"
+    """
+    moment = datetime.fromtimestamp(timestamp, timezone.utc)
+    meridiem = "PM" if moment.hour >= 12 else "AM"
+    return (f"{MONTHS[moment.month - 1]} {moment.day:02d}, {moment.year}, "
+            f"{moment.hour % 12 or 12}:{moment.minute:02d} {meridiem}")
+
+class UsernamePool:
+    """
+    Interned usernames with integer ids.
+    
+    A parser's relations share one pool, so a username that appears in
+    several relations is stored once.
+    """
+    
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._ids = {}
+        self._names = []
+    
+    def intern(self, username):
+        """
+        Get the id of a username, adding it to the pool if needed.
+        
+        Args:
+            username (str): The username
+            
+        Returns:
+            int: The username's id
+        """
+        username_id = self._ids.get(username)
+        if username_id is None:
+            username_id = len(self._names)
+            self._ids[username] = username_id
+            self._names.append(username)
+        return username_id
+    
+    def __getitem__(self, username_id):
+        """Return the username with the given id."""
+        return self._names[username_id]
+    
+    def __len__(self):
+        """Return the number of distinct usernames."""
+        return len(self._names)
+
+class UserStore(Sequence):
+    """
+    Column-oriented storage for the user records of one relation.
+    
+    Usernames are kept as ids into a shared ``UsernamePool``, timestamps
+    as epoch seconds and profile URLs as a one-byte kind, since almost all
+    of them are derived from the username. Only dates and URLs that can't
+    be reproduced from those columns are stored as strings.
+    
+    The store is a read-only sequence of ``{"username", "url", "timestamp"}``
+    dicts, built on access, so code written against lists of records keeps
+    working. Column accessors avoid building the dicts on hot paths.
+    """
+    
+    def __init__(self, pool=None, records=()):
+        """
+        Initialize the store.
+        
+        Args:
+            pool (UsernamePool, optional): Pool to intern usernames in
+            records (iterable): Initial user records
+        """
+        self.pool = pool if pool is not None else UsernamePool()
+        self._username_ids = array('l')
+        self._timestamps = array('q')
+        self._url_kinds = array('b')
+        self._explicit_urls = {}
+        self._raw_timestamps = {}
+        for record in records:
+            self.append(record["username"], record["url"], record["timestamp"])
+    
+    def append(self, username, url, timestamp):
+        """
+        Add a user record.
+        
+        Args:
+            username (str): The username
+            url (str): Profile URL
+            timestamp (str or int): Date as shown in the export, epoch
+                seconds, or "" if the record has no date
+        """
+        row = len(self._username_ids)
+        self._username_ids.append(self.pool.intern(username))
+        
+        if url == PROFILE_URL_PREFIX + username:
+            self._url_kinds.append(URL_PLAIN)
+        elif url == f"{PROFILE_URL_PREFIX}{username}/":
+            self._url_kinds.append(URL_SLASH)
+        else:
+            self._url_kinds.append(URL_EXPLICIT)
+            self._explicit_urls[row] = url
+            
+        if isinstance(timestamp, int):
+            self._timestamps.append(timestamp)
+        elif not timestamp:
+            self._timestamps.append(NO_TIMESTAMP)
+        else:
+            value = parse_export_date(timestamp)
+            if value is None or format_export_date(value) != timestamp:
+                # Keep dates that can't be reproduced exactly as text
+                self._raw_timestamps[row] = timestamp
+                value = NO_TIMESTAMP if value is None else value
+            self._timestamps.append(value)
+    
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._username_ids)
+    
+    def __getitem__(self, index):
+        """Return the record (or list of records for a slice) at an index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+            
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("UserStore index out of range")
+        return {
+            "username": self.username(index),
+            "url": self.url(index),
+            "timestamp": self.timestamp(index),
+        }
+    
+    def username(self, index):
+        """Return the username at an index."""
+        return self.pool[self._username_ids[index]]
+    
+    def usernames(self):
+        """Iterate over the usernames in record order."""
+        pool = self.pool
+        return (pool[username_id] for username_id in self._username_ids)
+    
+    def url(self, index):
+        """Return the profile URL at an index."""
+        kind = self._url_kinds[index]
+        if kind == URL_PLAIN:
+            return PROFILE_URL_PREFIX + self.username(index)
+        if kind == URL_SLASH:
+            return f"{PROFILE_URL_PREFIX}{self.username(index)}/"
+        return self._explicit_urls[index]
+    
+    def timestamp(self, index):
+        """Return the date at an index as shown in the export, or ""."""
+        raw = self._raw_timestamps.get(index)
+        if raw is not None:
+            return raw
+        value = self._timestamps[index]
+        return "" if value == NO_TIMESTAMP else format_export_date(value)
+    
+    def timestamp_value(self, index):
+        """Return the date at an index as epoch seconds, or None."""
+        value = self._timestamps[index]
+        return None if value == NO_TIMESTAMP else value
+    
+    def timestamp_values(self):
+        """Iterate over the dates as epoch seconds in record order, ``NO_TIMESTAMP`` if missing."""
+        return iter(self._timestamps)
+    
+    def take(self, indices):
+        """
+        Build a new store from selected records of this one.
+        
+        Args:
+            indices (iterable): Indices of the records to copy, in order
+            
+        Returns:
+            UserStore: Store sharing this store's username pool
+        """
+        subset = UserStore(self.pool)
+        for index in indices:
+            row = len(subset._username_ids)
+            subset._username_ids.append(self._username_ids[index])
+            subset._timestamps.append(self._timestamps[index])
+            subset._url_kinds.append(self._url_kinds[index])
+            if index in self._explicit_urls:
+                subset._explicit_urls[row] = self._explicit_urls[index]
+            if index in self._raw_timestamps:
+                subset._raw_timestamps[row] = self._raw_timestamps[index]
+        return subset
+    
+    def to_columns(self):
+        """
+        Export the store as plain, serializable columns.
+        
+        Returns:
+            dict: Column name to list (or dict for the sparse columns)
+        """
+        return {
+            "usernames": list(self.usernames()),
+            "timestamps": self._timestamps.tolist(),
+            "url_kinds": self._url_kinds.tolist(),
+            "explicit_urls": {str(row): url for row, url in self._explicit_urls.items()},
+            "raw_timestamps": {str(row): text for row, text in self._raw_timestamps.items()},
+        }
+    
+    @classmethod
+    def from_columns(cls, columns, pool=None):
+        """
+        Rebuild a store from columns produced by ``to_columns``.
+        
+        Args:
+            columns (dict): The exported columns
+            pool (UsernamePool, optional): Pool to intern usernames in
+            
+        Returns:
+            UserStore: The rebuilt store
+        """
+        store = cls(pool)
+        store._username_ids = array('l', (store.pool.intern(name) for name in columns["usernames"]))
+        store._timestamps = array('q', columns["timestamps"])
+        store._url_kinds = array('b', columns["url_kinds"])
+        store._explicit_urls = {int(row): url for row, url in columns["explicit_urls"].items()}
+        store._raw_timestamps = {int(row): text for row, text in columns["raw_timestamps"].items()}
+        return store
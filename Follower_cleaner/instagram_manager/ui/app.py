@@ -7,15 +7,17 @@ with Apple UI design standards applied.
 
 import os
 import tkinter as tk
-import webbrowser
 import logging
-import threading
 from tkinter import ttk, filedialog, messagebox
 
 from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.models.parse_cache import ParseCache
 from instagram_manager.ui.views.requests_view import RequestsTabView
 from instagram_manager.ui.views.pending_requests_view import PendingRequestsTabView
 from instagram_manager.ui.views.non_followers_view import NonFollowersTabView
+from instagram_manager.ui.views.changes_view import ChangesTabView
+from instagram_manager.utils.event_channel import EventChannel, ProgressEvent, ResultEvent, ErrorEvent
+from instagram_manager.utils.instrumentation import trace_directory
 
 logger = logging.getLogger(__name__)
 
@@ -47,18 +49,26 @@ class InstagramManagerApp:
         # Setup Apple-like styles
         self._setup_apple_styles()
         
-        # Initialize data parser
+        # Initialize data parser and the cache of already parsed exports
         self.data_parser = InstagramDataParser()
+        self.parse_cache = ParseCache()
         
         # Variables
         self.zip_path = tk.StringVar()
-        self.extract_dir = tk.StringVar()
         self.status_var = tk.StringVar(value="Ready")
         self.progress_var = tk.DoubleVar(value=0.0)
         
         # Create UI elements
         self._create_apple_ui()
         
+        # Events from the import thread are handled on the Tk main loop
+        self.events = EventChannel()
+        self.events.attach(self.root, self._handle_event)
+        
+        # Imports run one at a time; a new import supersedes the running one.
+        # The job manager is created by the first import, off the startup path
+        self.import_jobs = None
+        
         logger.info("Application UI initialized with Apple design standards")
     
     def _setup_apple_styles(self):
@@ -187,10 +197,25 @@ class InstagramManagerApp:
         self.non_followers_frame = ttk.Frame(self.notebook, padding=20)
         self.notebook.add(self.non_followers_frame, text="Non-Followers")
         
+        self.changes_frame = ttk.Frame(self.notebook, padding=20)
+        self.notebook.add(self.changes_frame, text="Changes")
+        
         # Initialize tab views
         self.requests_view = RequestsTabView(self.requests_frame, self.data_parser, self.status_var)
         self.pending_requests_view = PendingRequestsTabView(self.pending_requests_frame, self.data_parser, self.status_var)
         self.non_followers_view = NonFollowersTabView(self.non_followers_frame, self.data_parser, self.status_var)
+        self.changes_view = ChangesTabView(self.changes_frame, self.data_parser, self.status_var, self.parse_cache)
+        
+        # Views are filled when their tab is first shown, not on import;
+        # each remembers the data version it shows
+        self.tab_views = {
+            str(self.requests_frame): self.requests_view,
+            str(self.pending_requests_frame): self.pending_requests_view,
+            str(self.non_followers_frame): self.non_followers_view,
+            str(self.changes_frame): self.changes_view,
+        }
+        self.shown_versions = {}
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Progress and status bar in Apple style
         status_frame = ttk.Frame(main_frame)
@@ -225,7 +250,7 @@ class InstagramManagerApp:
         
         # Warning message with SF font
         warning_label = ttk.Label(file_frame, 
-                                text="Please download HTML files (not JSON) from Instagram's 'Download Your Information' page",
+                                text="Download your connections in HTML or JSON format from Instagram's 'Download Your Information' page",
                                 foreground="#FF3B30")  # Apple's red warning color
         warning_label.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=10)
         
@@ -233,7 +258,9 @@ class InstagramManagerApp:
         button_frame = ttk.Frame(file_frame)
         button_frame.grid(row=2, column=0, columnspan=3, pady=15)
         
-        ttk.Button(button_frame, text="Import Data", command=self.import_data).pack()
+        ttk.Button(button_frame, text="Import Data", command=self.import_data).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", style="Secondary.TButton",
+                   command=self.cancel_import).pack(side=tk.LEFT, padx=5)
     
     def browse_zip(self):
         """Browse for Instagram data zip file."""
@@ -243,112 +270,94 @@ class InstagramManagerApp:
         )
         if file_path:
             self.zip_path.set(file_path)
-            # Set default extract directory to same location as zip
-            default_extract = os.path.join(os.path.dirname(file_path), "instagram_data_extracted")
-            self.extract_dir.set(default_extract)
             logger.info(f"Selected zip file: {file_path}")
     
     def import_data(self):
         """Import and process Instagram data."""
-        if not self.zip_path.get():
+        zip_path = self.zip_path.get()
+        if not zip_path:
             messagebox.showerror("Error", "Please select an Instagram data export ZIP file")
             return
         
-        # Create extract directory if it doesn't exist
-        if not self.extract_dir.get():
-            self.extract_dir.set(os.path.join(os.path.dirname(self.zip_path.get()), "instagram_data_extracted"))
+        self.status_var.set("Reading zip file...")
+        self.progress_var.set(0)
         
-        if not os.path.exists(self.extract_dir.get()):
-            os.makedirs(self.extract_dir.get())
-        
-        # Extract and process in a separate thread
-        threading.Thread(target=self._process_data, daemon=True).start()
-    
-    def _process_data(self):
-        """Background process to extract and parse Instagram data."""
-        try:
-            self.status_var.set("Extracting zip file...")
-            self.progress_var.set(10)
-            
-            # Extract zip
-            success = self.data_parser.extract_zip(self.zip_path.get(), self.extract_dir.get())
-            if not success:
-                self.root.after(0, lambda: messagebox.showerror("Error", "Failed to extract ZIP file"))
-                self.status_var.set("Error extracting data")
-                return
-            
-            self.progress_var.set(30)
-            self.status_var.set("Processing follow requests received...")
-            
-            # Find and process HTML files
-            connections_dir = os.path.join(self.extract_dir.get(), "connections", "followers_and_following")
-            
-            # Parse follow requests
-            follow_requests_path = os.path.join(connections_dir, "follow_requests_you've_received.html")
-            if os.path.exists(follow_requests_path):
-                self.data_parser.parse_follow_requests(follow_requests_path)
-            else:
-                logger.warning(f"Follow requests file not found: {follow_requests_path}")
+        if self.import_jobs is None:
+            from instagram_manager.models.import_job import ImportJobManager
             
-            self.progress_var.set(40)
-            self.status_var.set("Processing pending follow requests sent...")
-            
-            # Parse pending follow requests sent
-            pending_sent_path = os.path.join(connections_dir, "pending_follow_requests.html")
-            if os.path.exists(pending_sent_path):
-                self.data_parser.parse_pending_sent_requests(pending_sent_path)
-            else:
-                logger.warning(f"Pending requests file not found: {pending_sent_path}")
-                # Try to find the file in a different location
-                for root, dirs, files in os.walk(self.extract_dir.get()):
-                    if "pending_follow_requests.html" in files:
-                        pending_sent_path = os.path.join(root, "pending_follow_requests.html")
-                        self.data_parser.parse_pending_sent_requests(pending_sent_path)
-                        logger.info(f"Found pending requests file at: {pending_sent_path}")
-                        break
-            
-            self.progress_var.set(50)
-            self.status_var.set("Processing followers...")
-            
-            # Parse followers
-            followers_path = os.path.join(connections_dir, "followers_1.html")
-            if os.path.exists(followers_path):
-                self.data_parser.parse_followers(followers_path)
-            else:
-                logger.warning(f"Followers file not found: {followers_path}")
-            
-            self.progress_var.set(70)
-            self.status_var.set("Processing following...")
-            
-            # Parse following
-            following_path = os.path.join(connections_dir, "following.html")
-            if os.path.exists(following_path):
-                self.data_parser.parse_following(following_path)
-            else:
-                logger.warning(f"Following file not found: {following_path}")
-            
-            self.progress_var.set(90)
-            self.status_var.set("Finding non-followers...")
-            
-            # Find non-followers
-            self.data_parser.find_non_followers()
+            self.import_jobs = ImportJobManager(on_progress=self.events.post_progress,
+                                                on_done=self.events.post_result,
+                                                on_error=self.events.post_error,
+                                                parse_cache=self.parse_cache)
             
+        # Parsed in a background job that reports back through self.events;
+        # an import that is still running is cancelled
+        self.import_jobs.start(zip_path)
+    
+    def cancel_import(self):
+        """Cancel the running import, keeping the data shown so far."""
+        if self.import_jobs is not None and self.import_jobs.cancel():
+            # Replaces any progress of the cancelled job not yet shown
+            self.events.post_progress(0, "Import cancelled")
+    
+    def _handle_event(self, event):
+        """
+        Apply an event from the import job on the Tk main loop.
+        
+        Args:
+            event (ProgressEvent, ResultEvent or ErrorEvent): The event to handle
+        """
+        if isinstance(event, ProgressEvent):
+            self.progress_var.set(event.percent)
+            self.status_var.set(event.message)
+        elif isinstance(event, ResultEvent):
+            job = event.payload
+            # Swap the finished import in; the views keep their parser
+            self.data_parser.replace_data(job.parser)
             self.progress_var.set(100)
-            self.status_var.set("Data processing complete")
-            
-            # Update UI
-            self.root.after(0, self.update_ui)
+            with job.trace.span("update_ui", "ui"):
+                self.update_ui()
             
-        except Exception as e:
-            logger.error(f"Error processing data: {e}", exc_info=True)
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to process data: {str(e)}"))
+            job.trace.log_summary()
+            if trace_directory():
+                job.trace.write_json(trace_directory())
+            self.status_var.set(job.trace.status_summary())
+            if job.parser.failed_files:
+                messagebox.showwarning("Incomplete import",
+                                       "These files couldn't be read, so their users are missing:\n"
+                                       + "\n".join(job.parser.failed_files))
+        elif isinstance(event, ErrorEvent):
             self.status_var.set("Error processing data")
+            messagebox.showerror("Error", event.message)
     
     def update_ui(self):
-        """Update all UI elements with the parsed data."""
-        self.requests_view.update_view()
-        self.pending_requests_view.update_view()
-        self.non_followers_view.update_view()
+        """Update the UI with the parsed data, filling only the visible tab."""
+        # Selecting another tab fills it through _on_tab_changed
+        if self.notebook.index("current") == 0:
+            self._refresh_tab(self.notebook.select())
+        else:
+            self.notebook.select(0)
+    
+    def _on_tab_changed(self, event):
+        """
+        Fill the newly selected tab if it doesn't show the current data yet.
         
-        # Select the first tab
-        self.notebook.select(0)
\ No newline at end of file
+        Args:
+            event (tk.Event): The tab change event
+        """
+        self._refresh_tab(self.notebook.select())
+    
+    def _refresh_tab(self, tab):
+        """
+        Update the view of a tab unless it already shows the current data.
+        
+        Args:
+            tab (str): Widget name of the tab's frame
+        """
+        view = self.tab_views.get(tab)
+        if view is None or self.shown_versions.get(tab) == self.data_parser.data_version:
+            return
+            
+        self.shown_versions[tab] = self.data_parser.data_version
+        view.update_view()
+        logger.debug(f"Filled tab {tab} with data version {self.data_parser.data_version}")
\ No newline at end of file
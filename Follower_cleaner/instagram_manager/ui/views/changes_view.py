@@ -0,0 +1,331 @@
+"""
+Changes Tab View Module
+
+This module handles the UI for the changes since a previous export tab.
+"""
+
+import tkinter as tk
+import logging
+import threading
+from tkinter import ttk, filedialog, messagebox
+
+from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.ui.widgets.chunked_task import ChunkedTask
+from instagram_manager.utils.browser import open_url
+from instagram_manager.utils.event_channel import ProgressEvent, ResultEvent, ErrorEvent, EventChannel
+
+logger = logging.getLogger(__name__)
+
+# Items deleted per step when tearing down old groups
+DELETE_BATCH_SIZE = 500
+
+class ChangesTabView:
+    """
+    View class for the changes since last export tab.
+    
+    This class compares the imported export with a previous export chosen
+    by the user and shows who followed, who unfollowed and what happened
+    to follow requests, grouped by kind of change. A group's rows are only
+    created when the group is expanded, and both filling and clearing the
+    tree run in time-budgeted batches on the Tk event loop.
+    """
+    
+    def __init__(self, parent, data_parser, status_var, parse_cache=None):
+        """
+        Initialize the changes tab view.
+        
+        Args:
+            parent (ttk.Frame): Parent frame for this view
+            data_parser (InstagramDataParser): The data parser instance with the current export
+            status_var (tk.StringVar): Status bar variable for displaying messages
+            parse_cache (ParseCache, optional): Cache used when loading the previous export
+        """
+        self.parent = parent
+        self.data_parser = data_parser
+        self.status_var = status_var
+        self.parse_cache = parse_cache
+        
+        logger.debug("Initializing ChangesTabView")
+        
+        # Previous export and the diff against it
+        self.previous_parser = None
+        self.diff = None
+        self._category_records = {}
+        self._tasks = {}
+        # Bumped by every diff request, so an older diff can't replace a newer one
+        self._diff_token = 0
+        self._diff_lock = threading.Lock()
+        
+        # Initialize empty UI
+        self.tree = None
+        self._create_ui()
+        
+        # Diffs computed in the background are handled on the Tk main loop
+        self.events = EventChannel()
+        self.events.attach(self.parent, self._handle_event)
+    
+    def _create_ui(self):
+        """Create the UI elements for the changes tab."""
+        # Header
+        ttk.Label(self.parent, text="Changes Since Last Export",
+                 style="Subheader.TLabel").grid(row=0, column=0,
+                                              sticky=tk.W, pady=(0, 10),
+                                              columnspan=4)
+                                              
+        # Create Treeview with one expandable group per kind of change
+        columns = ("URL",)
+        self.tree = ttk.Treeview(self.parent, columns=columns, show="tree headings", height=15)
+        
+        self.tree.heading("#0", text="Username")
+        self.tree.heading("URL", text="Profile URL")
+        
+        self.tree.column("#0", width=300)
+        self.tree.column("URL", width=400)
+        
+        self.tree.grid(row=1, column=0, columnspan=4, sticky="nsew", pady=10)
+        
+        # Add a scrollbar
+        scrollbar = ttk.Scrollbar(self.parent, orient=tk.VERTICAL, command=self.tree.yview)
+        scrollbar.grid(row=1, column=4, sticky="ns")
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        
+        ttk.Button(self.parent, text="Compare With Previous Export...", style="Secondary.TButton",
+                   command=self._choose_previous_export).grid(row=2, column=0, sticky=tk.W, pady=10)
+                   
+        # Make the treeview expandable
+        self.parent.grid_rowconfigure(1, weight=1)
+        self.parent.grid_columnconfigure(0, weight=1)
+        self.parent.grid_columnconfigure(1, weight=1)
+        self.parent.grid_columnconfigure(2, weight=1)
+        self.parent.grid_columnconfigure(3, weight=1)
+        
+        # Fill groups on expand, and add binding for clickable URL
+        self.tree.bind("<<TreeviewOpen>>", self._on_group_open)
+        self.tree.bind("<ButtonRelease-1>", self._on_treeview_click)
+    
+    def _on_treeview_click(self, event):
+        """
+        Handle clicks on the treeview to open URLs.
+        
+        Args:
+            event (tk.Event): The click event
+        """
+        region = self.tree.identify_region(event.x, event.y)
+        if region == "cell":
+            column = self.tree.identify_column(event.x)
+            if column == "#1":  # URL column
+                item = self.tree.identify_row(event.y)
+                if not item:
+                    return
+                    
+                values = self.tree.item(item, "values")
+                if not values:
+                    return
+                    
+                url = values[0]
+                if url:
+                    open_url(url)
+                    self.status_var.set(f"Opening {url}")
+    
+    def _choose_previous_export(self):
+        """Ask for an older export and compare the current data against it."""
+        file_path = filedialog.askopenfilename(
+            title="Select Previous Instagram Data Export",
+            filetypes=[("ZIP files", "*.zip")]
+        )
+        if not file_path:
+            return
+            
+        logger.info(f"Selected previous export: {file_path}")
+        self.status_var.set("Reading previous export...")
+        self._start_diff(self._load_previous_export, file_path)
+    
+    def _start_diff(self, target, *args):
+        """
+        Run a diff request in the background, superseding any running one.
+        
+        Args:
+            target (callable): Background process, called with the request's
+                token followed by ``args``
+            *args: Arguments for the background process
+        """
+        with self._diff_lock:
+            self._diff_token += 1
+            token = self._diff_token
+        # Drop what the superseded request already posted; it can't post more
+        self.events.drain()
+        threading.Thread(target=target, args=(token,) + args, daemon=True).start()
+    
+    def _notify(self, token, post, *args):
+        """
+        Post an event on behalf of a diff request if it is still the latest one.
+        
+        Args:
+            token (int): Token of the posting request
+            post (callable): ``EventChannel`` method to post with
+            *args: Arguments for the post
+        """
+        with self._diff_lock:
+            if token == self._diff_token:
+                post(*args)
+    
+    def _load_previous_export(self, token, file_path):
+        """
+        Background process to parse the previous export and diff against it.
+        
+        Args:
+            token (int): Token of the diff request
+            file_path (str): Path to the previous export ZIP
+        """
+        from instagram_manager.models.snapshot_diff import diff_snapshots
+        
+        def report(percent, message):
+            self._notify(token, self.events.post_progress, percent, message)
+            
+        try:
+            previous_parser = InstagramDataParser()
+            if not previous_parser.parse_zip(file_path, progress_callback=report, cache=self.parse_cache):
+                self._notify(token, self.events.post_error, "Failed to read previous export")
+                return
+            
+            report(95, "Comparing with the previous export...")
+            diff = diff_snapshots(previous_parser, self.data_parser)
+        except Exception as e:
+            logger.error(f"Error comparing with {file_path}: {e}", exc_info=True)
+            self._notify(token, self.events.post_error, f"Failed to compare with previous export: {str(e)}", e)
+            return
+        self._notify(token, self.events.post_result, (token, previous_parser, diff))
+    
+    def _handle_event(self, event):
+        """
+        Apply an event from a background diff on the Tk main loop.
+        
+        Args:
+            event (ProgressEvent, ResultEvent or ErrorEvent): The event to handle
+        """
+        if isinstance(event, ProgressEvent):
+            self.status_var.set(event.message)
+        elif isinstance(event, ResultEvent):
+            token, previous_parser, diff = event.payload
+            if token != self._diff_token:
+                logger.debug(f"Dropping diff of superseded request {token}")
+                return
+            self._show_diff(previous_parser, diff)
+        elif isinstance(event, ErrorEvent):
+            self.status_var.set("Error reading previous export")
+            messagebox.showerror("Error", event.message)
+    
+    def _show_diff(self, previous_parser, diff):
+        """
+        Display a computed diff.
+        
+        Args:
+            previous_parser (InstagramDataParser): Parser holding the previous export
+            diff (SnapshotDiff): Differences between the previous and current export
+        """
+        self.previous_parser = previous_parser
+        self.diff = diff
+        self._populate_groups()
+        self.status_var.set(f"Found {diff.total_changes()} changes since the previous export")
+    
+    def _populate_groups(self):
+        """Replace the tree contents with one collapsed group per change category."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks = {}
+        self._category_records = {}
+        
+        # Old groups are detached at once and deleted in the background
+        old_groups = self.tree.get_children()
+        if old_groups:
+            self.tree.detach(*old_groups)
+            ChunkedTask(self.tree, self._delete_groups(old_groups)).start()
+        
+        for key, label, records in self.diff.categories():
+            group = self.tree.insert("", "end", text=f"{label} ({len(records)})", values=("",))
+            self._category_records[group] = records
+            if records:
+                # Placeholder so the group can be expanded before its rows exist
+                self.tree.insert(group, "end", text="")
+    
+    def _delete_groups(self, groups):
+        """
+        Delete detached groups a batch of rows per step.
+        
+        Args:
+            groups (tuple): Item ids of the groups to delete
+        """
+        for group in groups:
+            children = self.tree.get_children(group)
+            for start in range(0, len(children), DELETE_BATCH_SIZE):
+                self.tree.delete(*children[start:start + DELETE_BATCH_SIZE])
+                yield
+            self.tree.delete(group)
+            yield
+    
+    def _on_group_open(self, event):
+        """
+        Start creating a group's rows the first time it is expanded.
+        
+        Rows are inserted in frame-sized batches so a group with hundreds of
+        thousands of users doesn't freeze the window while it fills.
+        
+        Args:
+            event (tk.Event): The open event
+        """
+        group = self.tree.focus()
+        records = self._category_records.pop(group, None)
+        if records is None:
+            return
+        
+        label = self.tree.item(group, "text")
+        self.tree.delete(*self.tree.get_children(group))
+        
+        def on_progress(done, total):
+            self.status_var.set(f"Loading {label}: {done:,}/{total:,}")
+        
+        def on_done():
+            self._tasks.pop(group, None)
+            self.status_var.set(f"Loaded {label}")
+        
+        self._tasks[group] = ChunkedTask(self.tree, self._insert_rows(group, records), total=len(records),
+                                         on_progress=on_progress, on_done=on_done).start()
+    
+    def _insert_rows(self, group, records):
+        """
+        Insert a group's rows one per step.
+        
+        Args:
+            group (str): Item id of the group
+            records (UserStore): Users in the group
+        """
+        for index in range(len(records)):
+            self.tree.insert(group, "end", text=records.username(index), values=(records.url(index),))
+            yield
+    
+    def update_view(self):
+        """Update the view with the latest data from the data parser."""
+        if self.previous_parser is None:
+            return
+        
+        self.status_var.set("Comparing with the previous export...")
+        self._start_diff(self._recompute_diff, self.previous_parser)
+    
+    def _recompute_diff(self, token, previous_parser):
+        """
+        Background process to diff the current data against the previous export.
+        
+        Args:
+            token (int): Token of the diff request
+            previous_parser (InstagramDataParser): Parser holding the previous export
+        """
+        from instagram_manager.models.snapshot_diff import diff_snapshots
+        
+        try:
+            diff = diff_snapshots(previous_parser, self.data_parser)
+        except Exception as e:
+            logger.error(f"Error comparing with the previous export: {e}", exc_info=True)
+            self._notify(token, self.events.post_error, f"Failed to compare with previous export: {str(e)}", e)
+            return
+        self._notify(token, self.events.post_result, (token, previous_parser, diff))
+        logger.info(f"Updated changes view with {diff.total_changes()} changes")
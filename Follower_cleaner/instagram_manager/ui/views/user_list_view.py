@@ -0,0 +1,184 @@
+"""
+User List View Module
+
+This module provides the base of the tabs that list the users of one
+relation, with search, sorting and, for dated relations, a date filter.
+"""
+
+import tkinter as tk
+import logging
+from collections import namedtuple
+from tkinter import ttk
+
+from instagram_manager.ui.widgets.date_filter import DateFilter
+from instagram_manager.ui.widgets.search_entry import SearchEntry
+from instagram_manager.ui.widgets.virtual_list import VirtualTreeview
+from instagram_manager.utils.browser import open_url
+
+logger = logging.getLogger(__name__)
+
+# A list column: Treeview column id, heading text, width, the UserStore
+# accessor giving its values, and the index column it sorts by (or None)
+ListColumn = namedtuple("ListColumn", ["name", "heading", "width", "field", "sort_column"])
+
+class UserListTabView:
+    """
+    Base view class for tabs listing the users of one relation.
+    
+    Subclasses name the parser attribute of the relation, the header text
+    and the columns; this class builds the list and wires the search box,
+    the column headings and the date filter to the relation's index. The
+    date filter is shown when the list has a date column.
+    """
+    
+    # Parser attribute holding the listed relation
+    RELATION = None
+    # Header text of the tab
+    TITLE = ""
+    # ListColumn of every column, in display order
+    COLUMNS = ()
+    
+    def __init__(self, parent, data_parser, status_var):
+        """
+        Initialize the view.
+        
+        Args:
+            parent (ttk.Frame): Parent frame for this view
+            data_parser (InstagramDataParser): The data parser instance with user data
+            status_var (tk.StringVar): Status bar variable for displaying messages
+        """
+        self.parent = parent
+        self.data_parser = data_parser
+        self.status_var = status_var
+        
+        logger.debug(f"Initializing {type(self).__name__}")
+        
+        # Initialize empty UI
+        self.list = None
+        self.tree = None
+        self.search = None
+        self.date_filter = None
+        self.index = None
+        self.sort_column = None
+        self.sort_descending = False
+        self._create_ui()
+    
+    def _create_ui(self):
+        """Create the UI elements for the tab."""
+        dated = any(column.field == "timestamp" for column in self.COLUMNS)
+        
+        # Header
+        ttk.Label(self.parent, text=self.TITLE,
+                 style="Subheader.TLabel").grid(row=0, column=0,
+                                              sticky=tk.W, pady=(0, 10),
+                                              columnspan=2 if dated else 3)
+        
+        if dated:
+            # Date filter, limiting the list to recent records
+            self.date_filter = DateFilter(self.parent, self._show_rows)
+            self.date_filter.grid(row=0, column=2, sticky=tk.E, padx=(0, 10), pady=(0, 10))
+        
+        # Search box, filtering the list as the user types
+        self.search = SearchEntry(self.parent, self._show_rows)
+        self.search.grid(row=0, column=3, columnspan=2, sticky=tk.E, pady=(0, 10))
+        
+        # Create Treeview for the relation
+        self.list = VirtualTreeview(self.parent, tuple(column.name for column in self.COLUMNS), height=15)
+        self.tree = self.list.tree
+        
+        for column in self.COLUMNS:
+            if column.sort_column:
+                self.tree.heading(column.name, text=column.heading,
+                                  command=lambda name=column.name: self._sort_by(name))
+            else:
+                self.tree.heading(column.name, text=column.heading)
+            self.tree.column(column.name, width=column.width)
+        
+        # The list brings its own scrollbar
+        self.list.grid(row=1, column=0, columnspan=5, sticky="nsew", pady=10)
+        
+        # Make the treeview expandable
+        self.parent.grid_rowconfigure(1, weight=1)
+        self.parent.grid_columnconfigure(0, weight=1)
+        self.parent.grid_columnconfigure(1, weight=1)
+        self.parent.grid_columnconfigure(2, weight=1)
+        self.parent.grid_columnconfigure(3, weight=1)
+        
+        # Add binding for clickable URL
+        self.tree.bind("<ButtonRelease-1>", self._on_treeview_click)
+    
+    def _on_treeview_click(self, event):
+        """
+        Handle clicks on the treeview to open URLs.
+        
+        Args:
+            event (tk.Event): The click event
+        """
+        url_index = [column.field for column in self.COLUMNS].index("url")
+        region = self.tree.identify_region(event.x, event.y)
+        if region == "cell":
+            column = self.tree.identify_column(event.x)
+            if column == f"#{url_index + 1}":  # URL column
+                item = self.tree.identify_row(event.y)
+                if not item:
+                    return
+                
+                values = self.tree.item(item, "values")
+                if not values or len(values) <= url_index:
+                    return
+                
+                url = values[url_index]
+                if url:
+                    open_url(url)
+                    self.status_var.set(f"Opening {url}")
+                else:
+                    self.status_var.set("No URL available")
+    
+    def update_view(self):
+        """Update the view with the latest data from the data parser."""
+        # The index was built with the import; looking it up is free
+        self.index = self.data_parser.user_index(self.RELATION)
+        self._show_rows()
+        
+        logger.info(f"Updated {self.RELATION} view with {len(self.index.store)} items")
+    
+    def _show_rows(self, *args):
+        """Show the users matching the search text and date filter."""
+        if self.index is None:
+            return
+        
+        # Only the visible rows are built, straight from the user store
+        users = self.index.store
+        start = self.date_filter.start() if self.date_filter else None
+        rows = self.index.search(self.search.get(), self.sort_column, self.sort_descending, start=start)
+        getters = [getattr(users, column.field) for column in self.COLUMNS]
+        
+        def row_values(index):
+            row = rows[index]
+            return tuple(getter(row) for getter in getters)
+        
+        self.list.set_rows(len(rows), row_values)
+    
+    def _sort_by(self, column):
+        """
+        Sort the list by a column, or reverse the order if it is sorted by it already.
+        
+        Args:
+            column (str): Treeview column whose heading was clicked
+        """
+        sort_column = next(spec.sort_column for spec in self.COLUMNS if spec.name == column)
+        if sort_column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = sort_column
+            self.sort_descending = False
+        
+        # Mark the sorted column's heading with the direction
+        for spec in self.COLUMNS:
+            if spec.sort_column:
+                text = spec.heading
+                if spec.sort_column == self.sort_column:
+                    text += " \u25bc" if self.sort_descending else " \u25b2"
+                self.tree.heading(spec.name, text=text)
+        
+        self._show_rows()
@@ -0,0 +1,90 @@
+"""
+Chunked Task Module
+
+This module runs long widget updates on the Tk main loop in small,
+time-budgeted batches so the window stays responsive.
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Time spent per batch, leaving the rest of a 60 Hz frame for Tk
+DEFAULT_FRAME_BUDGET = 0.012
+
+class ChunkedTask:
+    """
+    Work spread over the Tk event loop in frame-sized batches.
+    
+    The work is an iterator whose every step does one small unit (inserting
+    a row, deleting a batch of items, ...). Each batch runs steps until the
+    frame budget is used up, then yields back to Tk with ``after`` so that
+    redraws, scrolling and tab switches are handled between batches.
+    """
+    
+    def __init__(self, widget, steps, total=None, on_progress=None, on_done=None,
+                 frame_budget=DEFAULT_FRAME_BUDGET):
+        """
+        Initialize the task.
+        
+        Args:
+            widget (tk.Widget): Any widget, used to schedule the batches
+            steps (iterator): Iterator doing one unit of work per step
+            total (int, optional): Number of steps, for progress reporting
+            on_progress (callable, optional): Called as ``on_progress(done, total)``
+                after each batch
+            on_done (callable, optional): Called once all steps have run
+            frame_budget (float): Seconds of work per batch
+        """
+        self.widget = widget
+        self.steps = iter(steps)
+        self.total = total
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.frame_budget = frame_budget
+        self.done = 0
+        self._after_id = None
+        self._finished = False
+    
+    @property
+    def running(self):
+        """Whether the task has been started and has steps left."""
+        return self._after_id is not None
+    
+    def start(self):
+        """Schedule the first batch."""
+        if not self._finished and self._after_id is None:
+            self._after_id = self.widget.after(0, self._run_batch)
+        return self
+    
+    def cancel(self):
+        """Stop the task; steps not run yet are dropped."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._finished = True
+    
+    def _run_batch(self):
+        """Run steps until the frame budget is spent, then reschedule."""
+        deadline = time.perf_counter() + self.frame_budget
+        try:
+            for _ in self.steps:
+                self.done += 1
+                if time.perf_counter() >= deadline:
+                    break
+            else:
+                self._after_id = None
+                self._finished = True
+                if self.on_done:
+                    self.on_done()
+                return
+        except Exception as e:
+            logger.error(f"Error in chunked task: {e}", exc_info=True)
+            self._after_id = None
+            self._finished = True
+            return
+            
+        if self.on_progress:
+            self.on_progress(self.done, self.total)
+        self._after_id = self.widget.after(1, self._run_batch)
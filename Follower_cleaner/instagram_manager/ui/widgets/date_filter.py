@@ -0,0 +1,67 @@
+"""
+Date Filter Widget Module
+
+This module provides a labelled drop-down for limiting a list to recent
+records.
+"""
+
+import tkinter as tk
+import logging
+from datetime import datetime
+from tkinter import ttk
+
+from instagram_manager.models.user_store import SECONDS_PER_DAY, export_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Choices of the drop-down: label to number of days, None for no limit
+DATE_FILTERS = {
+    "All time": None,
+    "Last 7 days": 7,
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "Last year": 365,
+}
+
+class DateFilter:
+    """
+    Drop-down that limits a list to the records of the last days.
+    
+    The callback is called whenever another choice is made; ``start`` gives
+    the first epoch second of the chosen range.
+    """
+    
+    def __init__(self, parent, on_change):
+        """
+        Initialize the date filter.
+        
+        Args:
+            parent (tk.Widget): Parent widget
+            on_change (callable): Called without arguments when the choice changes
+        """
+        self.on_change = on_change
+        self.var = tk.StringVar(value=next(iter(DATE_FILTERS)))
+        
+        self.frame = ttk.Frame(parent)
+        ttk.Label(self.frame, text="Show:").pack(side=tk.LEFT, padx=(0, 5))
+        self.combobox = ttk.Combobox(self.frame, textvariable=self.var, values=list(DATE_FILTERS),
+                                     state="readonly", width=14)
+        self.combobox.pack(side=tk.LEFT)
+        
+        self.combobox.bind("<<ComboboxSelected>>", lambda event: self.on_change())
+    
+    def grid(self, **kwargs):
+        """Place the date filter with the grid geometry manager."""
+        self.frame.grid(**kwargs)
+    
+    def start(self):
+        """
+        Get the start of the chosen range.
+        
+        Returns:
+            int: First epoch second of the range, or None for all time
+        """
+        days = DATE_FILTERS.get(self.var.get())
+        if days is None:
+            return None
+        return export_timestamp(datetime.now()) - days * SECONDS_PER_DAY
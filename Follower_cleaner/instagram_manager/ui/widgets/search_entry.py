@@ -0,0 +1,52 @@
+"""
+Search Entry Widget Module
+
+This module provides a labelled search field that reports every change
+of its text.
+"""
+
+import tkinter as tk
+import logging
+from tkinter import ttk
+
+logger = logging.getLogger(__name__)
+
+class SearchEntry:
+    """
+    Search field that filters as the user types.
+    
+    The callback is called with the current text after every keystroke;
+    Escape clears the field.
+    """
+    
+    def __init__(self, parent, on_change, width=30):
+        """
+        Initialize the search field.
+        
+        Args:
+            parent (tk.Widget): Parent widget
+            on_change (callable): Called as ``on_change(text)`` whenever the text changes
+            width (int): Width of the entry in characters
+        """
+        self.on_change = on_change
+        self.var = tk.StringVar()
+        
+        self.frame = ttk.Frame(parent)
+        ttk.Label(self.frame, text="Search:").pack(side=tk.LEFT, padx=(0, 5))
+        self.entry = ttk.Entry(self.frame, textvariable=self.var, width=width)
+        self.entry.pack(side=tk.LEFT)
+        
+        self.var.trace_add("write", lambda *args: self.on_change(self.var.get()))
+        self.entry.bind("<Escape>", lambda event: self.clear())
+    
+    def grid(self, **kwargs):
+        """Place the search field with the grid geometry manager."""
+        self.frame.grid(**kwargs)
+    
+    def get(self):
+        """Return the current search text."""
+        return self.var.get()
+    
+    def clear(self):
+        """Empty the search field."""
+        self.var.set("")
@@ -0,0 +1,260 @@
+"""
+Virtual List Widget Module
+
+This module provides a Treeview-based list that only creates items for
+the rows currently on screen.
+"""
+
+import tkinter as tk
+import logging
+from tkinter import ttk
+
+logger = logging.getLogger(__name__)
+
+# Fallbacks until the real geometry can be measured from a rendered item
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_HEADER_HEIGHT = 25
+
+# Mouse wheel delta of one notch on Windows
+WHEEL_DELTA = 120
+
+class VirtualTreeview:
+    """
+    Virtualized list built on a ttk.Treeview.
+    
+    Instead of one Treeview item per row, the widget keeps a small pool of
+    items covering the visible window plus a few rows of overscan, and
+    rewrites their values as the list scrolls. Rows are fetched on demand
+    from a ``row_values(index)`` callback, so filling, scrolling and
+    clearing the list cost the same for ten rows or a million.
+    
+    The Treeview is available as ``tree``; its visible items carry the
+    values of their rows, so click handlers can keep reading them.
+    """
+    
+    def __init__(self, parent, columns, height=15, overscan=5):
+        """
+        Initialize the virtual list.
+        
+        Args:
+            parent (tk.Widget): Parent widget
+            columns (tuple): Column identifiers of the Treeview
+            height (int): Initial number of visible rows
+            overscan (int): Extra items kept beyond the visible rows
+        """
+        self.overscan = overscan
+        self.row_count = 0
+        self._row_values = None
+        self._offset = 0
+        self._visible_rows = height
+        self._selected_index = None
+        self._items = []
+        
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings",
+                                 height=height, selectmode="browse")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        # "win32", "aqua" (macOS) or "x11"; they report mouse wheel deltas differently
+        self._windowing_system = self.tree.tk.call("tk", "windowingsystem")
+        # Wheel movement not yet scrolled, in fractions of a notch
+        self._wheel_remainder = 0
+        
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+        
+        # Scrolling is driven by the row offset, never by the Treeview itself
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_rows(3))
+        self.tree.bind("<Up>", lambda event: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda event: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda event: self._move_selection(-self._visible_rows))
+        self.tree.bind("<Next>", lambda event: self._move_selection(self._visible_rows))
+        self.tree.bind("<Home>", lambda event: self._move_selection(-self.row_count))
+        self.tree.bind("<End>", lambda event: self._move_selection(self.row_count))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+    
+    def grid(self, **kwargs):
+        """Place the list (Treeview and scrollbar) with the grid geometry manager."""
+        self.frame.grid(**kwargs)
+    
+    def set_rows(self, row_count, row_values):
+        """
+        Replace the rows shown by the list.
+        
+        Args:
+            row_count (int): Number of rows
+            row_values (callable): Returns the tuple of column values for a
+                row index; only called for rows that are on screen
+        """
+        self.row_count = row_count
+        self._row_values = row_values
+        self._offset = 0
+        self._selected_index = None
+        self._render()
+    
+    def refresh(self):
+        """Redraw the visible rows, e.g. after the underlying data changed."""
+        self._render()
+    
+    def index_of(self, item):
+        """
+        Get the row index shown by a Treeview item.
+        
+        Args:
+            item (str): Treeview item id
+            
+        Returns:
+            int: Row index, or None if the item isn't part of the list
+        """
+        try:
+            return self._offset + self._items.index(item)
+        except ValueError:
+            return None
+    
+    def scroll_to(self, offset):
+        """
+        Scroll so that the given row is the first visible one.
+        
+        Args:
+            offset (int): Row index to show at the top
+        """
+        max_offset = max(0, self.row_count - self._visible_rows)
+        offset = min(max(0, offset), max_offset)
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+    
+    def _render(self):
+        """Resize the item pool to the window and fill it from the current offset."""
+        wanted = max(0, min(self._visible_rows + self.overscan, self.row_count - self._offset))
+        
+        # Grow or shrink the pool by the difference only
+        while len(self._items) < wanted:
+            self._items.append(self.tree.insert("", "end"))
+        if len(self._items) > wanted:
+            self.tree.delete(*self._items[wanted:])
+            del self._items[wanted:]
+            
+        for position, item in enumerate(self._items):
+            self.tree.item(item, values=self._row_values(self._offset + position))
+            
+        # Keep the selection on the same row while it is on screen
+        position = None if self._selected_index is None else self._selected_index - self._offset
+        if position is not None and 0 <= position < len(self._items):
+            self.tree.selection_set(self._items[position])
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+            
+        self.tree.yview_moveto(0)
+        self._update_scrollbar()
+    
+    def _update_scrollbar(self):
+        """Sync the scrollbar with the visible window."""
+        if self.row_count <= self._visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / self.row_count,
+                               (self._offset + self._visible_rows) / self.row_count)
+    
+    def _measure_visible_rows(self, height):
+        """
+        Compute how many rows fit in the Treeview.
+        
+        Args:
+            height (int): Height of the Treeview in pixels
+            
+        Returns:
+            int: Number of fully visible rows
+        """
+        header_height, row_height = DEFAULT_HEADER_HEIGHT, DEFAULT_ROW_HEIGHT
+        if self._items:
+            bbox = self.tree.bbox(self._items[0])
+            if bbox:
+                header_height, row_height = bbox[1], bbox[3]
+        return max(1, (height - header_height) // row_height)
+    
+    def _on_configure(self, event):
+        """Adjust the item pool when the Treeview is resized."""
+        visible_rows = self._measure_visible_rows(event.height)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._offset = min(self._offset, max(0, self.row_count - visible_rows))
+            self._render()
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        """
+        Handle scrollbar commands.
+        
+        Args:
+            action (str): "moveto" or "scroll"
+            amount (str): Fraction for "moveto", step count for "scroll"
+            unit (str): "units" or "pages" for "scroll"
+        """
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * self.row_count))
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_rows(int(amount) * step)
+    
+    def _on_mousewheel(self, event):
+        """Scroll on mouse wheel events (Windows and macOS)."""
+        if self._windowing_system == "aqua":
+            # macOS reports small deltas, one per step
+            notches = event.delta
+        else:
+            # Windows reports 120 per notch, and fractions of it from
+            # high-resolution wheels and touchpads; those add up until
+            # they make a whole notch, and what is left over carries on
+            total = self._wheel_remainder + event.delta
+            notches = int(total / WHEEL_DELTA)
+            self._wheel_remainder = total - notches * WHEEL_DELTA
+        if notches:
+            self._scroll_rows(-3 * notches)
+        return "break"
+    
+    def _scroll_rows(self, rows):
+        """
+        Scroll by a number of rows.
+        
+        Args:
+            rows (int): Rows to scroll, negative to scroll up
+        """
+        self.scroll_to(self._offset + rows)
+        return "break"
+    
+    def _on_select(self, event):
+        """Remember which row is selected so it survives scrolling."""
+        selection = self.tree.selection()
+        if selection:
+            index = self.index_of(selection[0])
+            if index is not None:
+                self._selected_index = index
+    
+    def _move_selection(self, rows):
+        """
+        Move the selection with the keyboard, scrolling as needed.
+        
+        Args:
+            rows (int): Rows to move, negative to move up
+        """
+        if not self.row_count:
+            return "break"
+            
+        current = self._offset if self._selected_index is None else self._selected_index
+        index = min(max(0, current + rows), self.row_count - 1)
+        self._selected_index = index
+        if index < self._offset:
+            self._offset = index
+        elif index >= self._offset + self._visible_rows:
+            self._offset = index - self._visible_rows + 1
+        self._render()
+        
+        position = index - self._offset
+        if 0 <= position < len(self._items):
+            self.tree.focus(self._items[position])
+        return "break"
@@ -0,0 +1,24 @@
+"""
+Browser Module
+
+This module opens links, such as users' profiles, in the web browser.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+def open_url(url):
+    """
+    Open a URL in the default web browser.
+    
+    ``webbrowser`` is imported here on first use rather than at startup;
+    utils.startup warms it up in the background.
+    
+    Args:
+        url (str): The URL to open
+    """
+    import webbrowser
+    
+    logger.info(f"Opening URL: {url}")
+    webbrowser.open(url)
@@ -0,0 +1,115 @@
+"""
+Event Channel Module
+
+This module passes progress, results and errors from background threads
+to the Tk main loop without touching Tk from those threads.
+"""
+
+import queue
+import logging
+import threading
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+ProgressEvent = namedtuple("ProgressEvent", ["percent", "message"])
+ResultEvent = namedtuple("ResultEvent", ["payload"])
+ErrorEvent = namedtuple("ErrorEvent", ["message", "exception"])
+
+# How often the main loop drains the channel
+DEFAULT_POLL_INTERVAL_MS = 50
+
+class EventChannel:
+    """
+    Thread-safe channel of typed events for the Tk main loop.
+    
+    Background threads post events from any thread; the main loop drains
+    them on a timer and handles them where touching widgets is safe.
+    Progress is coalesced: only the latest progress event is kept between
+    two drains, so a fast worker can't flood the UI with updates. Result
+    and error events are queued and delivered in order; they supersede the
+    progress posted before them, so a late progress update never shows up
+    after the job has finished.
+    """
+    
+    def __init__(self):
+        """Initialize an empty channel."""
+        self._events = queue.Queue()
+        self._progress = None
+        self._lock = threading.Lock()
+        self._after_id = None
+    
+    def post_progress(self, percent, message):
+        """
+        Post a progress update, replacing any update not yet drained.
+        
+        Args:
+            percent (float): Progress value for the progress bar
+            message (str): Status message to display
+        """
+        with self._lock:
+            self._progress = ProgressEvent(percent, message)
+    
+    def post_result(self, payload=None):
+        """
+        Post the result of a background job.
+        
+        Args:
+            payload (object): Result passed to the handler
+        """
+        self._post(ResultEvent(payload))
+    
+    def post_error(self, message, exception=None):
+        """
+        Post an error from a background job.
+        
+        Args:
+            message (str): Message to show the user
+            exception (Exception, optional): The exception that was raised
+        """
+        self._post(ErrorEvent(message, exception))
+    
+    def _post(self, event):
+        """Queue an event, dropping the progress it supersedes."""
+        with self._lock:
+            self._progress = None
+            self._events.put(event)
+    
+    def drain(self):
+        """
+        Take all pending events.
+        
+        Returns:
+            list: Pending events in posting order
+        """
+        events = []
+        with self._lock:
+            while True:
+                try:
+                    events.append(self._events.get_nowait())
+                except queue.Empty:
+                    break
+            # Any progress left was posted after the last queued event
+            if self._progress:
+                events.append(self._progress)
+                self._progress = None
+        return events
+    
+    def attach(self, widget, handler, interval_ms=DEFAULT_POLL_INTERVAL_MS):
+        """
+        Drain the channel periodically on the Tk main loop.
+        
+        Args:
+            widget (tk.Widget): Any widget, used to schedule the drains
+            handler (callable): Called with each event on the main thread
+            interval_ms (int): Milliseconds between drains
+        """
+        def tick():
+            for event in self.drain():
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(f"Error handling {type(event).__name__}: {e}", exc_info=True)
+            self._after_id = widget.after(interval_ms, tick)
+            
+        self._after_id = widget.after(interval_ms, tick)
@@ -2,36 +2,194 @@
 Logger Module
 
 This module sets up logging for the application.
+
+Records are put on a queue by the logging call and written to the console
+and to a rotating log file by a background thread, so code logging on a
+hot path never waits for the disk.
 """
 
 import os
+import json
+import time
+import queue
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+from datetime import datetime, timezone
+
+# Directory of the log files
+LOG_DIR = os.path.join(os.path.expanduser("~"), ".instagram_manager", "logs")
+LOG_FILE_NAME = "instagram_manager.log"
+
+# Rotate the log file at this size, keeping this many old files
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# Log files not written to for this long are deleted at startup
+MAX_LOG_AGE_DAYS = 30
+
+# Set to "json" to write one JSON object per line instead of plain text
+LOG_FORMAT_ENVIRONMENT_VARIABLE = "INSTAGRAM_MANAGER_LOG_FORMAT"
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# The listener of the current setup, stopped when logging is set up again
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter writing each record as a single-line JSON object.
+    
+    The object has the time (ISO 8601, UTC), level, logger name, message,
+    thread name and, for errors logged with ``exc_info``, the traceback.
+    """
+    
+    def format(self, record):
+        """
+        Format a record as JSON.
+        
+        Args:
+            record (logging.LogRecord): The record to format
+            
+        Returns:
+            str: The JSON line
+        """
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener's handlers.
+    
+    The standard handler formats the whole record before queueing it, which
+    folds the traceback into the message. This one only resolves what can't
+    cross threads safely (the message arguments and the exception), so the
+    JSON formatter can still report the traceback separately.
+    """
+    
+    def prepare(self, record):
+        """
+        Make a copy of the record that is safe to hand to another thread.
+        
+        Args:
+            record (logging.LogRecord): The record being logged
+            
+        Returns:
+            logging.LogRecord: The prepared copy
+        """
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared = logging.makeLogRecord(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        prepared.exc_info = None
+        return prepared
 
-def setup_logger(log_level=logging.INFO):
+def prune_logs(log_dir, max_age_days=MAX_LOG_AGE_DAYS):
+    """
+    Delete old log files, including those of versions that wrote one per launch.
+    
+    Args:
+        log_dir (str): Directory of the log files
+        max_age_days (int): Delete files not modified for this many days
+        
+    Returns:
+        int: Number of files deleted
+    """
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    deleted = 0
+    try:
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if (entry.name.startswith("instagram_manager") and ".log" in entry.name
+                        and entry.is_file() and entry.stat().st_mtime < cutoff):
+                    try:
+                        os.remove(entry.path)
+                        deleted += 1
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    return deleted
+
+def stop_logging():
+    """Write out the queued records and stop the background writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+def _log_directly_after_fork():
+    """
+    Make a forked child process, e.g. a parser worker, write its records itself.
+    
+    The listener's thread doesn't survive a fork, so records queued in the
+    child would never be written. The child only writes to the console:
+    the log file belongs to the parent, and several processes writing and
+    rotating it would interleave or lose records.
+    """
+    global _listener
+    if _listener is None:
+        return
+        
+    logger = logging.getLogger("instagram_manager")
+    for handler in list(logger.handlers):
+        if isinstance(handler, _QueueHandler):
+            logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        if not isinstance(handler, logging.FileHandler):
+            logger.addHandler(handler)
+    _listener = None
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_log_directly_after_fork)
+
+def setup_logger(log_level=logging.INFO, log_dir=LOG_DIR, json_format=None):
     """
     Set up and configure the application logger.
     
     Args:
         log_level (int): The logging level to use (default: logging.INFO)
-        
+        log_dir (str): Directory to write the log file to
+        json_format (bool, optional): Whether to log JSON lines; defaults to
+            the ``INSTAGRAM_MANAGER_LOG_FORMAT`` environment variable
+            
     Returns:
         logging.Logger: The configured logger
     """
+    global _listener
+    if json_format is None:
+        json_format = os.environ.get(LOG_FORMAT_ENVIRONMENT_VARIABLE, "").lower() == "json"
+        
     # Create logs directory if it doesn't exist
-    log_dir = os.path.join(os.path.expanduser("~"), ".instagram_manager", "logs")
     os.makedirs(log_dir, exist_ok=True)
+    pruned = prune_logs(log_dir)
+    log_file = os.path.join(log_dir, LOG_FILE_NAME)
     
-    # Generate log filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"instagram_manager_{timestamp}.log")
-    
-    # Configure logging
+    # Configure logging; setting up again replaces the previous setup
     logger = logging.getLogger("instagram_manager")
     logger.setLevel(log_level)
-    
-    # File handler
-    file_handler = logging.FileHandler(log_file)
+    stop_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+        
+    # File handler, rotated by size
+    file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=MAX_LOG_BYTES,
+                                                        backupCount=LOG_BACKUP_COUNT,
+                                                        encoding='utf-8')
     file_handler.setLevel(log_level)
     
     # Console handler
@@ -39,13 +197,20 @@ def setup_logger(log_level=logging.INFO):
     console_handler.setLevel(log_level)
     
     # Formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The handlers run on the listener's thread; loggers only enqueue
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                               respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(_QueueHandler(log_queue))
+    atexit.unregister(stop_logging)
+    atexit.register(stop_logging)
     
     logger.info(f"Logging started. Log file: {log_file}")
-    return logger
\ No newline at end of file
+    if pruned:
+        logger.info(f"Deleted {pruned} log files older than {MAX_LOG_AGE_DAYS} days")
+    return logger
@@ -0,0 +1,49 @@
+"""
+Tests of locating the connection files of an export.
+"""
+
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from instagram_manager.models.export_index import CONNECTIONS_DIR, ExportIndex
+
+def index_of(*names):
+    """Build the index of an archive holding the given members."""
+    return ExportIndex([zipfile.ZipInfo(name) for name in names])
+
+def test_html_export():
+    index = index_of("media/posts/1.jpg", f"{CONNECTIONS_DIR}/followers_1.html",
+                     f"{CONNECTIONS_DIR}/following.html", f"{CONNECTIONS_DIR}/pending_follow_requests.html")
+    assert index.export_format == "html"
+    assert index.member("pending_requests") == f"{CONNECTIONS_DIR}/pending_follow_requests.html"
+    assert index.member("follow_requests") is None
+    assert index.shards("following") == [f"{CONNECTIONS_DIR}/following.html"]
+
+def test_json_export_ignores_stray_html_files():
+    index = index_of(f"{CONNECTIONS_DIR}/followers_1.json", f"{CONNECTIONS_DIR}/following.json",
+                     f"{CONNECTIONS_DIR}/follow_requests_you've_received.json",
+                     "your_activity/followers_1.html")
+    assert index.export_format == "json"
+    assert index.shards("followers") == [f"{CONNECTIONS_DIR}/followers_1.json"]
+    assert index.member("follow_requests") == f"{CONNECTIONS_DIR}/follow_requests_you've_received.json"
+
+def test_copies_in_the_connections_directory_win():
+    index = index_of("backup/followers_1.html", f"{CONNECTIONS_DIR}/followers_1.html",
+                     "backup/followers_2.html", "old/following.html",
+                     "old/pending_follow_requests.html", f"{CONNECTIONS_DIR}/pending_follow_requests.html")
+    assert index.shards("followers") == [f"{CONNECTIONS_DIR}/followers_1.html"]
+    assert index.member("pending_requests") == f"{CONNECTIONS_DIR}/pending_follow_requests.html"
+    assert index.find("followers_1.html") == f"{CONNECTIONS_DIR}/followers_1.html"
+    # Elsewhere is fine when the usual directory has no copy at all
+    assert index.shards("following") == ["old/following.html"]
+    assert index.find("followers_2.html") == "backup/followers_2.html"
+
+def test_shards_are_in_numeric_order_after_the_unnumbered_file():
+    index = index_of(*(f"{CONNECTIONS_DIR}/{name}" for name in
+                       ("followers_10.html", "followers_2.html", "followers.html", "followers_1.html")))
+    assert index.shards("followers") == [f"{CONNECTIONS_DIR}/{name}" for name in
+                                         ("followers.html", "followers_1.html", "followers_2.html",
+                                          "followers_10.html")]
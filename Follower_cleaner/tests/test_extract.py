@@ -0,0 +1,97 @@
+"""
+Tests of extracting an export to disk.
+"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from instagram_manager.models.data_parser import InstagramDataParser, _member_path
+from instagram_manager.models.export_index import CONNECTIONS_DIR, ExtractManifest
+
+MEMBERS = {
+    f"{CONNECTIONS_DIR}/followers_1.html": b"<html>followers</html>",
+    "media/posts/1.jpg": b"\xff\xd8 photo",
+    "your_activity/messages/inbox/alice_1/photos/2.jpg": b"\xff\xd8 attachment",
+    "your_activity/messages/inbox/alice_1/message_1.html": b"<html>message</html>",
+}
+
+@pytest.fixture
+def export(tmp_path):
+    """An export ZIP holding ``MEMBERS``."""
+    zip_path = str(tmp_path / "export.zip")
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_ref:
+        for name, data in MEMBERS.items():
+            zip_ref.writestr(name, data)
+    return zip_path
+
+def extracted_files(extract_dir):
+    """List the files under a directory as member names."""
+    return sorted(os.path.relpath(os.path.join(root, name), extract_dir).replace(os.sep, "/")
+                  for root, _, names in os.walk(extract_dir) for name in names)
+
+def test_default_manifest_leaves_out_media_and_attachments():
+    manifest = ExtractManifest()
+    assert [name for name in MEMBERS if manifest.wants(name)] == [
+        f"{CONNECTIONS_DIR}/followers_1.html", "your_activity/messages/inbox/alice_1/message_1.html"]
+
+def test_manifest_include_and_exclude():
+    manifest = ExtractManifest(include=[f"{CONNECTIONS_DIR}/*", "*.jpg"], exclude=["media/*"])
+    assert [name for name in MEMBERS if manifest.wants(name)] == [
+        f"{CONNECTIONS_DIR}/followers_1.html", "your_activity/messages/inbox/alice_1/photos/2.jpg"]
+    assert not any(ExtractManifest(include=[]).wants(name) for name in MEMBERS)
+    assert all(ExtractManifest(exclude=[]).wants(name) for name in MEMBERS)
+
+def test_manifest_skips_directories():
+    infos = [zipfile.ZipInfo(f"{CONNECTIONS_DIR}/"), zipfile.ZipInfo(f"{CONNECTIONS_DIR}/following.html")]
+    assert [info.filename for info in ExtractManifest().select(infos)] == [f"{CONNECTIONS_DIR}/following.html"]
+
+def test_extract_writes_the_wanted_members(export, tmp_path):
+    extract_dir = str(tmp_path / "out")
+    assert InstagramDataParser().extract_zip(export, extract_dir, max_workers=2)
+    assert extracted_files(extract_dir) == sorted(
+        [f"{CONNECTIONS_DIR}/followers_1.html", "your_activity/messages/inbox/alice_1/message_1.html"])
+    with open(os.path.join(extract_dir, CONNECTIONS_DIR, "followers_1.html"), 'rb') as file:
+        assert file.read() == MEMBERS[f"{CONNECTIONS_DIR}/followers_1.html"]
+
+def test_re_extract_skips_files_with_the_same_size_and_crc(export, tmp_path):
+    extract_dir = str(tmp_path / "out")
+    parser = InstagramDataParser()
+    assert parser.extract_zip(export, extract_dir)
+    
+    unchanged = os.path.join(extract_dir, "your_activity", "messages", "inbox", "alice_1", "message_1.html")
+    changed = os.path.join(extract_dir, CONNECTIONS_DIR, "followers_1.html")
+    os.utime(unchanged, (0, 0))
+    # Same size, different contents: the CRC tells them apart
+    with open(changed, 'wb') as file:
+        file.write(b"<html>FOLLOWERS</html>")
+    os.utime(changed, (0, 0))
+    
+    assert parser.extract_zip(export, extract_dir)
+    assert os.path.getmtime(unchanged) == 0
+    assert os.path.getmtime(changed) != 0
+    with open(changed, 'rb') as file:
+        assert file.read() == MEMBERS[f"{CONNECTIONS_DIR}/followers_1.html"]
+
+@pytest.mark.parametrize("member_name, parts", [
+    ("connections/followers_1.html", ["connections", "followers_1.html"]),
+    ("../../etc/passwd", ["etc", "passwd"]),
+    ("/etc/passwd", ["etc", "passwd"]),
+    ("a/./b/../c.html", ["a", "b", "c.html"]),
+    ("..\\..\\etc\\passwd", ["etc", "passwd"]),
+])
+def test_member_path_drops_parent_and_root_components(tmp_path, member_name, parts):
+    assert _member_path(str(tmp_path), member_name) == os.path.join(str(tmp_path), *parts)
+
+def test_member_path_with_a_drive_stays_in_the_extraction_directory(tmp_path):
+    path = _member_path(str(tmp_path), "C:\\Windows\\system.ini")
+    assert os.path.commonpath([str(tmp_path), path]) == str(tmp_path)
+    assert path.endswith(os.path.join("Windows", "system.ini"))
+
+@pytest.mark.parametrize("member_name", ["", "/", "..", "../.."])
+def test_member_path_of_an_empty_name(tmp_path, member_name):
+    assert _member_path(str(tmp_path), member_name) is None
@@ -0,0 +1,96 @@
+"""
+Tests of the HTML record extractor backends.
+
+Every backend must return the same records as the others, in the same
+order, for the same file.
+"""
+
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.synthetic_export import PAGE_FOOTER, PAGE_HEADER, generate_export, record_block
+from instagram_manager.models.data_parser import HTML_BACKENDS
+from instagram_manager.models.html_extractor import BACKENDS, FILE_BACKENDS
+
+def extract_all(html_text, tmp_path):
+    """
+    Run every backend over the same HTML.
+    
+    Args:
+        html_text (str): The HTML file's contents
+        tmp_path (pathlib.Path): Directory to write the file to for the file backends
+        
+    Returns:
+        dict: Backend name to extracted records
+    """
+    path = tmp_path / "connections.html"
+    path.write_text(html_text, encoding='utf-8')
+    results = {name: extract(io.StringIO(html_text)) for name, extract in BACKENDS.items()}
+    for name, extract in FILE_BACKENDS.items():
+        results[f"{name} (file)"] = list(extract(str(path)))
+    return results
+
+def assert_same_records(results):
+    """Check that all backends returned the same records."""
+    expected = results["stream"]
+    for name, records in results.items():
+        assert records == expected, f"{name} backend differs from stream backend"
+
+def test_parser_knows_every_backend():
+    assert set(HTML_BACKENDS) == set(BACKENDS)
+    assert set(FILE_BACKENDS) <= set(BACKENDS)
+
+@pytest.fixture(scope="module")
+def export_members(tmp_path_factory):
+    """Connection files of a small synthetic export, by member name."""
+    zip_path = tmp_path_factory.mktemp("export") / "export.zip"
+    generate_export(str(zip_path), users=500, shard_size=200, media_mb=0)
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        return {name: zip_ref.read(name).decode('utf-8')
+                for name in zip_ref.namelist() if name.endswith(".html")}
+
+def test_backends_agree_on_synthetic_export(export_members, tmp_path):
+    assert len(export_members) == 6
+    for name, html_text in export_members.items():
+        results = extract_all(html_text, tmp_path)
+        assert results["stream"], f"no records found in {name}"
+        assert_same_records(results)
+
+def test_record_without_date(tmp_path):
+    html_text = (PAGE_HEADER.format(title="Follow requests")
+                 + record_block("first", "Jan 05, 2024, 3:12 PM")
+                 + record_block("undated", "")
+                 + record_block("last", "Feb 29, 2024, 11:59 PM")
+                 + PAGE_FOOTER)
+    results = extract_all(html_text, tmp_path)
+    assert_same_records(results)
+    assert [(record["username"], record["timestamp"]) for record in results["stream"]] == [
+        ("first", "Jan 05, 2024, 3:12 PM"),
+        ("undated", ""),
+        ("last", "Feb 29, 2024, 11:59 PM"),
+    ]
+
+@pytest.mark.parametrize("block", [
+    # Date div with attributes
+    '<div class="_a6-p"><div><div><a href="https://www.instagram.com/first">first</a></div>'
+    '<div class="d">Jan 05, 2024, 3:12 PM</div></div></div>',
+    # Inline markup and character references in the date and link text
+    '<div class="_a6-p"><div><div><a href="https://www.instagram.com/first"><b>first</b></a></div>'
+    '<div><span>Jan 05, 2024,</span> 3:12&nbsp;PM</div></div></div>',
+    # Upper case tags
+    '<DIV class="_a6-p"><DIV><DIV><A HREF="https://www.instagram.com/first">first</A></DIV>'
+    '<DIV>Jan 05, 2024, 3:12 PM</DIV></DIV></DIV>',
+    # Link without a following date div
+    '<div class="_a6-p"><div><div><a href="https://www.instagram.com/first">first</a></div></div></div>',
+])
+def test_backends_agree_on_markup_variants(block, tmp_path):
+    html_text = PAGE_HEADER.format(title="Followers") + block + record_block("second", "") + PAGE_FOOTER
+    results = extract_all(html_text, tmp_path)
+    assert_same_records(results)
+    assert [record["username"] for record in results["stream"]] == ["first", "second"]
@@ -0,0 +1,45 @@
+"""
+Tests of the JSON record extractor.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.models.json_extractor import extract_records_json
+from instagram_manager.models.user_store import UserStore
+
+def entry(username, timestamp):
+    """Build one entry of a connection JSON file."""
+    return {"title": "", "media_list_data": [], "string_list_data": [
+        {"href": f"https://www.instagram.com/{username}", "value": username, "timestamp": timestamp}]}
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    """Run the test in a time zone several hours behind UTC."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time zones can't be changed on this platform")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def test_recent_records_include_json_dates_of_the_last_hours(new_york_time):
+    now = int(time.time())
+    followers = [entry("an_hour_ago", now - 3600), entry("two_days_ago", now - 2 * 24 * 3600),
+                 entry("undated", None)]
+    records = extract_records_json(io.StringIO(json.dumps(followers)))
+    
+    parser = InstagramDataParser()
+    parser.follow_requests = UserStore(parser.username_pool, records)
+    recent = parser.recent_records("follow_requests", 1)
+    assert list(recent.usernames()) == ["an_hour_ago"]
+    assert len(parser.recent_records("follow_requests", 3)) == 2
@@ -0,0 +1,53 @@
+"""
+Tests of caching parsed exports.
+"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from benchmarks.synthetic_export import PAGE_HEADER, PAGE_FOOTER, record_block
+from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.models.export_index import CONNECTIONS_DIR
+from instagram_manager.models.parse_cache import ParseCache
+
+def write_export(zip_path, followers_page):
+    """Write an export whose followers file holds the given text."""
+    following = "".join(record_block(username, "Jan 05, 2024, 3:12 PM") for username in ("alice", "bob"))
+    with zipfile.ZipFile(zip_path, 'w') as zip_ref:
+        zip_ref.writestr(f"{CONNECTIONS_DIR}/following.html",
+                         PAGE_HEADER.format(title="Following") + following + PAGE_FOOTER)
+        zip_ref.writestr(f"{CONNECTIONS_DIR}/followers_1.html", followers_page)
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_failed_member_is_reported_and_not_cached(tmp_path, max_workers):
+    zip_path = str(tmp_path / "export.zip")
+    # Not UTF-8, so the followers file can't be decoded
+    write_export(zip_path, b"\xff\xfe<html>")
+    cache = ParseCache(str(tmp_path / "cache"))
+    
+    parser = InstagramDataParser()
+    assert parser.parse_zip(zip_path, max_workers=max_workers, cache=cache)
+    assert parser.failed_files == [f"{CONNECTIONS_DIR}/followers_1.html"]
+    assert list(parser.following.usernames()) == ["alice", "bob"]
+    assert not os.path.isdir(cache.cache_dir) or not os.listdir(cache.cache_dir)
+
+def test_complete_import_is_cached(tmp_path):
+    zip_path = str(tmp_path / "export.zip")
+    write_export(zip_path, PAGE_HEADER.format(title="Followers") + record_block("alice", "") + PAGE_FOOTER)
+    cache = ParseCache(str(tmp_path / "cache"))
+    
+    parser = InstagramDataParser()
+    assert parser.parse_zip(zip_path, max_workers=1, cache=cache)
+    assert parser.failed_files == []
+    # Only the finished entry is left, under its own name
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        assert os.listdir(cache.cache_dir) == [f"{cache.archive_key(zip_ref)}.json.gz"]
+    
+    cached = InstagramDataParser()
+    assert cached.parse_zip(zip_path, max_workers=1, cache=cache)
+    assert list(cached.non_followers.usernames()) == ["bob"]
@@ -0,0 +1,67 @@
+"""
+Tests of the snapshot diff engine against a set-based reference.
+"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from instagram_manager.models.data_parser import InstagramDataParser
+from instagram_manager.models.snapshot_diff import CHANGE_CATEGORIES, diff_snapshots
+from instagram_manager.models.user_store import UserStore
+
+RELATIONS = ("followers", "following", "follow_requests", "pending_sent_requests")
+
+def random_snapshot(rng, names):
+    """Build a parser whose relations hold random, differently cased subsets of the names."""
+    parser = InstagramDataParser()
+    for attribute in RELATIONS:
+        chosen = [name for name in names if rng.random() < 0.5]
+        rng.shuffle(chosen)
+        records = [{"username": name.upper() if rng.random() < 0.2 else name,
+                    "url": f"https://www.instagram.com/{name}", "timestamp": ""}
+                   for name in chosen]
+        setattr(parser, attribute, UserStore(parser.username_pool, records))
+    return parser
+
+def keys(store):
+    """Return the case-folded usernames of a store as a set."""
+    return {username.lower() for username in store.usernames()}
+
+def expected_changes(old, new):
+    """Compute the change categories with plain set operations."""
+    old_keys = {attribute: keys(getattr(old, attribute)) for attribute in RELATIONS}
+    new_keys = {attribute: keys(getattr(new, attribute)) for attribute in RELATIONS}
+    sent_resolved = old_keys["pending_sent_requests"] - new_keys["pending_sent_requests"]
+    received_resolved = old_keys["follow_requests"] - new_keys["follow_requests"]
+    return {
+        "new_followers": new_keys["followers"] - old_keys["followers"],
+        "lost_followers": old_keys["followers"] - new_keys["followers"],
+        "started_following": new_keys["following"] - old_keys["following"],
+        "stopped_following": old_keys["following"] - new_keys["following"],
+        "sent_requests_accepted": sent_resolved & new_keys["following"],
+        "sent_requests_withdrawn": sent_resolved - new_keys["following"],
+        "new_sent_requests": new_keys["pending_sent_requests"] - old_keys["pending_sent_requests"],
+        "received_requests_accepted": received_resolved & new_keys["followers"],
+        "received_requests_withdrawn": received_resolved - new_keys["followers"],
+        "new_received_requests": new_keys["follow_requests"] - old_keys["follow_requests"],
+    }
+
+def test_diff_matches_set_operations():
+    rng = random.Random(7)
+    names = [f"user_{i:03d}" for i in range(300)]
+    for _ in range(20):
+        old, new = random_snapshot(rng, names), random_snapshot(rng, names)
+        diff = diff_snapshots(old, new)
+        expected = expected_changes(old, new)
+        for key, _ in CHANGE_CATEGORIES:
+            records = getattr(diff, key)
+            usernames = [username.lower() for username in records.usernames()]
+            assert usernames == sorted(expected[key]), key
+        assert diff.total_changes() == sum(len(changes) for changes in expected.values())
+
+def test_identical_snapshots_have_no_changes():
+    snapshot = random_snapshot(random.Random(1), [f"user_{i}" for i in range(50)])
+    assert diff_snapshots(snapshot, snapshot).total_changes() == 0
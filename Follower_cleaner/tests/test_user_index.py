@@ -0,0 +1,92 @@
+"""
+Tests of the user index's search, sort and date range queries against a
+brute-force scan of the store.
+"""
+
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from instagram_manager.models.user_index import UserIndex
+from instagram_manager.models.user_store import UserStore, format_export_date
+
+PREFIXES = ["", "a", "A", "ab", " b_ ", "zzz"]
+
+@pytest.fixture(scope="module")
+def store():
+    """A store of random usernames, some sharing prefixes, some without a date."""
+    rng = random.Random(3)
+    records = []
+    for i in range(2000):
+        username = "".join(rng.choice("abcAB_1") for _ in range(rng.randint(1, 6))) + str(i)
+        timestamp = "" if rng.random() < 0.1 else format_export_date(rng.randrange(10 ** 9, 2 * 10 ** 9, 60))
+        records.append({"username": username, "url": f"https://www.instagram.com/{username}",
+                        "timestamp": timestamp})
+    return UserStore(records=records)
+
+def brute_force(store, prefix, start=None, end=None):
+    """Find the matching rows by checking every record."""
+    prefix = prefix.strip().casefold()
+    rows = []
+    for row in range(len(store)):
+        value = store.timestamp_value(row)
+        if not store.username(row).casefold().startswith(prefix):
+            continue
+        if (start is not None or end is not None) and value is None:
+            continue
+        if start is not None and value < start:
+            continue
+        if end is not None and value >= end:
+            continue
+        rows.append(row)
+    return rows
+
+def sort_key(store, column):
+    """Return the key a column sorts rows by; undated rows sort first."""
+    if column == "username":
+        return lambda row: store.username(row).casefold()
+    return lambda row: (store.timestamp_value(row) or -1, store.username(row).casefold())
+
+@pytest.mark.parametrize("prefix", PREFIXES)
+def test_search_matches_brute_force(store, prefix):
+    assert sorted(UserIndex(store).search(prefix)) == brute_force(store, prefix)
+
+def test_unsorted_search_without_filters_is_store_order(store):
+    assert list(UserIndex(store).search()) == list(range(len(store)))
+
+@pytest.mark.parametrize("prefix", PREFIXES)
+def test_sorted_search(store, prefix):
+    index = UserIndex(store)
+    expected = brute_force(store, prefix)
+    for column in ("username", "date"):
+        rows = list(index.search(prefix, column=column))
+        assert rows == sorted(expected, key=sort_key(store, column))
+        assert list(index.search(prefix, column=column, descending=True)) == rows[::-1]
+
+@pytest.mark.parametrize("prefix", PREFIXES)
+@pytest.mark.parametrize("dates", [(None, None), (1.2e9, None), (None, 1.5e9), (1.3e9, 1.4e9)])
+def test_search_by_date(store, prefix, dates):
+    index = UserIndex(store)
+    start, end = (None if moment is None else int(moment) for moment in dates)
+    expected = brute_force(store, prefix, start, end)
+    
+    assert sorted(index.search(prefix, start=start, end=end)) == expected
+    for column in ("username", "date"):
+        rows = list(index.search(prefix, column=column, start=start, end=end))
+        assert rows == sorted(expected, key=sort_key(store, column))
+        descending = list(index.search(prefix, column=column, descending=True, start=start, end=end))
+        assert descending == rows[::-1]
+
+def test_between_is_oldest_first(store):
+    rows = list(UserIndex(store).between(int(1.2e9), int(1.6e9)))
+    assert rows == sorted(brute_force(store, "", int(1.2e9), int(1.6e9)), key=sort_key(store, "date"))
+
+def test_store_index_out_of_range(store):
+    assert store[-1] == store[len(store) - 1]
+    for index in (len(store), -len(store) - 1, -2 * len(store)):
+        with pytest.raises(IndexError):
+            store[index]